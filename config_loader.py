@@ -1,35 +1,67 @@
-import json
-import os
-from pathlib import Path
-from typing import Dict, Any, Optional
-
-def load_api_config() -> Dict[str, Any]:
-    """
-    从api_config.json加载API配置
-    
-    Returns:
-        包含API配置的字典
-    """
-    try:
-        # 首先尝试在当前目录及父目录查找api_config.json
-        config_paths = [
-            Path("api_config.json"),                # 当前目录
-            Path("../api_config.json"),             # 父目录
-            Path(__file__).parent / "api_config.json",  # 脚本所在目录
-            Path(__file__).parent.parent / "api_config.json",  # 脚本所在目录的父目录
-            Path.home() / "api_config.json",        # 用户主目录
-            Path("/etc/api_config.json")            # 系统配置目录 (Linux/Mac)
-        ]
-        
-        for config_path in config_paths:
-            if config_path.exists():
-                print(f"找到配置文件: {config_path}")
-                with open(config_path, "r", encoding="utf-8") as f:
-                    return json.load(f)
-                    
-        print("警告: 未找到api_config.json文件")
-        return {}  # 未找到配置文件，返回空字典
-        
-    except Exception as e:
-        print(f"警告: 读取api_config.json时出错: {str(e)}")
-        return {} 
\ No newline at end of file
+import json
+import os
+from typing import Dict, Any, Optional
+
+# api_config.json的候选路径，按优先级排列（导入时计算一次）
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+_CONFIG_PATHS = (
+    "api_config.json",                                        # 当前目录
+    os.path.join("..", "api_config.json"),                    # 父目录
+    os.path.join(_SCRIPT_DIR, "api_config.json"),             # 脚本所在目录
+    os.path.join(os.path.dirname(_SCRIPT_DIR), "api_config.json"),  # 脚本所在目录的父目录
+    os.path.join(os.path.expanduser("~"), "api_config.json"),  # 用户主目录
+    "/etc/api_config.json"                                    # 系统配置目录 (Linux/Mac)
+)
+
+# 成功加载的配置缓存；未找到或解析失败时不缓存，下次调用会重新查找
+_config_cache: Optional[Dict[str, Any]] = None
+
+def load_api_config() -> Dict[str, Any]:
+    """
+    从api_config.json加载API配置（成功加载的结果会被缓存，修改配置文件后可调用load_api_config.cache_clear()重新加载）
+    
+    Returns:
+        包含API配置的字典
+    """
+    global _config_cache
+    config = _config_cache
+    if config is None:
+        config = _load_api_config_uncached()
+        if config is None:
+            return {}  # 未找到配置文件或读取出错，返回空字典
+        _config_cache = config
+    # 返回副本，避免调用方修改缓存中的配置
+    return dict(config)
+
+def _clear_config_cache() -> None:
+    """清除缓存的配置"""
+    global _config_cache
+    _config_cache = None
+
+# 暴露缓存清理接口
+load_api_config.cache_clear = _clear_config_cache
+
+def _load_api_config_uncached() -> Optional[Dict[str, Any]]:
+    """
+    实际查找并解析api_config.json
+    
+    Returns:
+        包含API配置的字典，未找到配置文件或读取出错时返回None
+    """
+    try:
+        for config_path in _CONFIG_PATHS:
+            # 依次在候选路径中查找api_config.json，直接尝试打开文件，省去单独的exists()检查
+            try:
+                f = open(config_path, "r", encoding="utf-8")
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            print(f"找到配置文件: {config_path}")
+            with f:
+                return json.load(f)
+                    
+        print("警告: 未找到api_config.json文件")
+        return None
+        
+    except Exception as e:
+        print(f"警告: 读取api_config.json时出错: {str(e)}")
+        return None
@@ -1,236 +1,460 @@
-import pandas as pd
-import numpy as np
-import os
-from typing import Dict, Any, List, Optional, Tuple, Union
-
-class ExcelParser:
-    """Excel文件解析工具"""
-    
-    def __init__(self):
-        """初始化Excel解析器"""
-        pass
-        
-    def extract_data(self, excel_path: str, sheet_name: Optional[str] = None) -> str:
-        """
-        从Excel文件中提取数据
-        
-        Args:
-            excel_path: Excel文件路径
-            sheet_name: 工作表名称，如果不指定则读取第一个工作表
-            
-        Returns:
-            提取的文本内容，格式化为便于处理的文本
-        """
-        try:
-            # 检查文件是否存在
-            if not os.path.exists(excel_path):
-                return f"错误: 文件不存在 - {excel_path}"
-                
-            # 检查文件扩展名
-            _, ext = os.path.splitext(excel_path)
-            if ext.lower() not in ['.xls', '.xlsx', '.xlsm', '.csv']:
-                return f"错误: 不支持的文件类型 - {ext}"
-            
-            # 对CSV文件特殊处理
-            if ext.lower() == '.csv':
-                df = pd.read_csv(excel_path)
-                text_content = self._dataframe_to_text(df)
-                return text_content
-            
-            # 读取Excel文件
-            try:
-                if sheet_name:
-                    df = pd.read_excel(excel_path, sheet_name=sheet_name)
-                else:
-                    # 尝试列出所有工作表
-                    excel_file = pd.ExcelFile(excel_path)
-                    sheet_names = excel_file.sheet_names
-                    
-                    if not sheet_names:
-                        return "错误: Excel文件中没有找到工作表"
-                    
-                    # 默认使用第一个工作表
-                    df = pd.read_excel(excel_path, sheet_name=sheet_names[0])
-                    
-                    # 如果只读取了表头，尝试读取其他工作表
-                    if len(df) == 0 and len(sheet_names) > 1:
-                        for name in sheet_names[1:]:
-                            temp_df = pd.read_excel(excel_path, sheet_name=name)
-                            if len(temp_df) > 0:
-                                df = temp_df
-                                break
-            except Exception as e:
-                return f"读取Excel文件时出错: {str(e)}"
-            
-            # 检查DataFrame是否为空
-            if len(df) == 0 or len(df.columns) == 0:
-                return "错误: Excel文件中没有数据"
-                
-            # 将DataFrame转换为文本格式
-            text_content = self._dataframe_to_text(df)
-            
-            return text_content
-        except Exception as e:
-            return f"解析Excel数据时出错: {str(e)}"
-    
-    def extract_row(self, excel_path: str, row_index: int = 0, sheet_name: Optional[str] = None) -> Tuple[str, int]:
-        """
-        从Excel文件中提取指定行的数据
-        
-        Args:
-            excel_path: Excel文件路径
-            row_index: 要提取的行索引（0表示第一行数据，不含表头）
-            sheet_name: 工作表名称，如果不指定则读取第一个工作表
-            
-        Returns:
-            (提取的文本内容，总行数) 元组
-        """
-        try:
-            # 检查文件是否存在
-            if not os.path.exists(excel_path):
-                return f"错误: 文件不存在 - {excel_path}", 0
-                
-            # 检查文件扩展名
-            _, ext = os.path.splitext(excel_path)
-            if ext.lower() not in ['.xls', '.xlsx', '.xlsm', '.csv']:
-                return f"错误: 不支持的文件类型 - {ext}", 0
-            
-            # 读取Excel文件
-            df = None
-            try:
-                if ext.lower() == '.csv':
-                    df = pd.read_csv(excel_path)
-                elif sheet_name:
-                    df = pd.read_excel(excel_path, sheet_name=sheet_name)
-                else:
-                    # 尝试列出所有工作表
-                    excel_file = pd.ExcelFile(excel_path)
-                    sheet_names = excel_file.sheet_names
-                    
-                    if not sheet_names:
-                        return "错误: Excel文件中没有找到工作表", 0
-                    
-                    # 默认使用第一个工作表
-                    df = pd.read_excel(excel_path, sheet_name=sheet_names[0])
-            except Exception as e:
-                return f"读取Excel文件时出错: {str(e)}", 0
-            
-            # 检查DataFrame是否为空
-            if df is None or len(df) == 0 or len(df.columns) == 0:
-                return "错误: Excel文件中没有数据", 0
-                
-            # 检查行索引是否有效
-            total_rows = len(df)
-            if row_index < 0 or row_index >= total_rows:
-                return f"错误: 行索引 {row_index} 超出范围，文件共有 {total_rows} 行数据", total_rows
-                
-            # 提取指定行
-            row_df = df.iloc[[row_index]]
-            
-            # 将单行数据转换为文本格式
-            text_content = self._row_to_text(row_df, row_index)
-            
-            return text_content, total_rows
-        except Exception as e:
-            return f"解析Excel行数据时出错: {str(e)}", 0
-    
-    def _row_to_text(self, row_df: pd.DataFrame, row_index: int) -> str:
-        """
-        将单行DataFrame转换为文本格式
-        
-        Args:
-            row_df: 包含单行数据的DataFrame
-            row_index: 原始数据中的行索引
-            
-        Returns:
-            文本表示
-        """
-        text_lines = []
-        
-        # 添加基本信息
-        text_lines.append(f"Excel数据 - 第 {row_index+1} 行:")
-        text_lines.append(f"列名: {', '.join(row_df.columns.astype(str))}")
-        text_lines.append("")
-        
-        # 处理行数据
-        row = row_df.iloc[0]  # 获取第一行（唯一的一行）
-        for col_name in row_df.columns:
-            value = row[col_name]
-            # 跳过NaN值
-            if pd.notna(value):
-                # 处理各种数据类型
-                if isinstance(value, (int, float)):
-                    if value == int(value):  # 检查是否为整数值的浮点数
-                        formatted_value = str(int(value))
-                    else:
-                        formatted_value = str(value)
-                elif isinstance(value, (np.integer, np.floating)):
-                    if value == int(value):
-                        formatted_value = str(int(value))
-                    else:
-                        formatted_value = str(value)
-                elif isinstance(value, (list, dict)):
-                    # 转换复杂类型为字符串
-                    formatted_value = str(value)
-                else:
-                    formatted_value = str(value)
-                    
-                text_lines.append(f"  {col_name}: {formatted_value}")
-        
-        return "\n".join(text_lines)
-    
-    def _dataframe_to_text(self, df: pd.DataFrame) -> str:
-        """
-        将DataFrame转换为文本格式
-        
-        Args:
-            df: Pandas DataFrame对象
-            
-        Returns:
-            文本表示，每行是"列名: 值"的格式
-        """
-        try:
-            text_lines = []
-            
-            # 添加列名作为标题
-            text_lines.append("Excel数据内容：")
-            text_lines.append(f"总行数: {len(df)}")
-            text_lines.append(f"列名: {', '.join(df.columns.astype(str))}")
-            text_lines.append("")
-            
-            # 处理每一行数据
-            for idx, row in df.iterrows():
-                text_lines.append(f"行 {idx+1}:")
-                for col_name in df.columns:
-                    value = row[col_name]
-                    # 跳过NaN值
-                    if pd.notna(value):
-                        # 处理各种数据类型
-                        if isinstance(value, (int, float)):
-                            if value == int(value):  # 检查是否为整数值的浮点数
-                                formatted_value = str(int(value))
-                            else:
-                                formatted_value = str(value)
-                        elif isinstance(value, (np.integer, np.floating)):
-                            if value == int(value):
-                                formatted_value = str(int(value))
-                            else:
-                                formatted_value = str(value)
-                        elif isinstance(value, (list, dict)):
-                            # 转换复杂类型为字符串
-                            formatted_value = str(value)
-                        else:
-                            formatted_value = str(value)
-                            
-                        text_lines.append(f"  {col_name}: {formatted_value}")
-                        
-                text_lines.append("")  # 空行分隔每行数据
-                
-                # 如果数据量太大，只展示前20行
-                if idx >= 19 and len(df) > 20:
-                    text_lines.append(f"... 已省略剩余 {len(df) - 20} 行数据 ...")
-                    break
-                    
-            return "\n".join(text_lines)
-        except Exception as e:
-            return f"格式化DataFrame时出错: {str(e)}" 
\ No newline at end of file
+from __future__ import annotations
+
+import os
+import numbers
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    import pandas as pd
+else:
+    # pandas导入开销较大，首次解析文件时才导入，见_import_pandas()
+    pd = None
+
+# 文本预览最多展示的数据行数
+PREVIEW_ROWS = 20
+
+# 分块读取CSV文件时每块的行数
+CSV_CHUNK_ROWS = 1000
+
+# 优先使用基于Rust的calamine引擎解析Excel，未安装时使用pandas默认引擎
+# （pandas默认的openpyxl引擎已经以read_only/data_only模式打开工作簿）
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE: Optional[str] = "calamine"
+except ImportError:
+    EXCEL_ENGINE = None
+
+def _import_pandas():
+    """首次调用时导入pandas并缓存到模块全局变量"""
+    global pd
+    if pd is None:
+        import pandas
+        pd = pandas
+    return pd
+
+class ExcelParseError(Exception):
+    """Excel解析失败时抛出的异常，异常信息可直接展示给用户"""
+    
+    def __init__(self, message: str, total_rows: int = 0):
+        """
+        Args:
+            message: 错误信息
+            total_rows: 已知的数据总行数（例如行索引超出范围时），未知时为0
+        """
+        super().__init__(message)
+        self.total_rows = total_rows
+
+class ExcelParser:
+    """Excel文件解析工具"""
+    
+    def __init__(self):
+        """初始化Excel解析器"""
+        pass
+        
+    def extract_data(self, excel_path: str, sheet_name: Optional[str] = None) -> str:
+        """
+        从Excel文件中提取数据
+        
+        Args:
+            excel_path: Excel文件路径
+            sheet_name: 工作表名称，如果不指定则读取第一个工作表
+            
+        Returns:
+            提取的文本内容，格式化为便于处理的文本
+            
+        Raises:
+            ExcelParseError: 文件不存在、类型不支持、没有数据或读取失败
+        """
+        _import_pandas()
+        
+        try:
+            # 检查文件是否存在（只做一次stat调用）
+            try:
+                os.stat(excel_path)
+            except OSError:
+                raise ExcelParseError(f"错误: 文件不存在 - {excel_path}")
+                
+            # 检查文件扩展名
+            ext = self._get_extension(excel_path)
+            if ext.lower() not in ['.xls', '.xlsx', '.xlsm', '.csv']:
+                raise ExcelParseError(f"错误: 不支持的文件类型 - {ext}")
+            
+            # 对CSV文件特殊处理
+            if ext.lower() == '.csv':
+                df, total_rows = self._read_csv_preview(excel_path)
+                text_content = self._dataframe_to_text(df, total_rows)
+                return text_content
+            
+            # 读取Excel文件（只读取预览所需的行），所有工作表共用同一个ExcelFile句柄
+            try:
+                with pd.ExcelFile(excel_path, engine=EXCEL_ENGINE) as excel_file:
+                    if sheet_name:
+                        df, total_rows = self._read_preview(excel_file, sheet_name)
+                    else:
+                        # 尝试列出所有工作表
+                        sheet_names = excel_file.sheet_names
+                        
+                        if not sheet_names:
+                            raise ExcelParseError("错误: Excel文件中没有找到工作表")
+                        
+                        # 默认使用第一个工作表
+                        df, total_rows = self._read_preview(excel_file, sheet_names[0])
+                        
+                        # 如果只读取了表头，尝试读取其他工作表
+                        if len(df) == 0 and len(sheet_names) > 1:
+                            for name in sheet_names[1:]:
+                                temp_df, temp_total = self._read_preview(excel_file, name)
+                                if len(temp_df) > 0:
+                                    df, total_rows = temp_df, temp_total
+                                    break
+            except ExcelParseError:
+                raise
+            except Exception as e:
+                raise ExcelParseError(f"读取Excel文件时出错: {str(e)}") from e
+            
+            # 检查DataFrame是否为空
+            if len(df) == 0 or len(df.columns) == 0:
+                raise ExcelParseError("错误: Excel文件中没有数据")
+                
+            # 将DataFrame转换为文本格式
+            text_content = self._dataframe_to_text(df, total_rows)
+            
+            return text_content
+        except ExcelParseError:
+            raise
+        except Exception as e:
+            raise ExcelParseError(f"解析Excel数据时出错: {str(e)}") from e
+    
+    def extract_row(self, excel_path: str, row_index: int = 0, sheet_name: Optional[str] = None) -> Tuple[str, int]:
+        """
+        从Excel文件中提取指定行的数据
+        
+        Args:
+            excel_path: Excel文件路径
+            row_index: 要提取的行索引（0表示第一行数据，不含表头）
+            sheet_name: 工作表名称，如果不指定则读取第一个工作表
+            
+        Returns:
+            (提取的文本内容，总行数) 元组
+            
+        Raises:
+            ExcelParseError: 文件不存在、类型不支持、没有数据、行索引超出范围或读取失败
+        """
+        _import_pandas()
+        
+        try:
+            # 检查文件是否存在（只做一次stat调用）
+            try:
+                os.stat(excel_path)
+            except OSError:
+                raise ExcelParseError(f"错误: 文件不存在 - {excel_path}")
+                
+            # 检查文件扩展名
+            ext = self._get_extension(excel_path)
+            if ext.lower() not in ['.xls', '.xlsx', '.xlsm', '.csv']:
+                raise ExcelParseError(f"错误: 不支持的文件类型 - {ext}")
+            
+            # 对CSV文件特殊处理
+            if ext.lower() == '.csv':
+                try:
+                    row_df, total_rows = self._read_csv_row(excel_path, row_index)
+                except Exception as e:
+                    raise ExcelParseError(f"读取Excel文件时出错: {str(e)}") from e
+                
+                # 检查文件是否为空
+                if total_rows == 0:
+                    raise ExcelParseError("错误: Excel文件中没有数据")
+                
+                # 检查行索引是否有效
+                if row_df is None:
+                    raise ExcelParseError(f"错误: 行索引 {row_index} 超出范围，文件共有 {total_rows} 行数据", total_rows)
+                
+                text_content = self._row_to_text(row_df, row_index)
+                return text_content, total_rows
+            
+            # 读取Excel文件，列出工作表和读取数据共用同一个ExcelFile句柄
+            try:
+                with pd.ExcelFile(excel_path, engine=EXCEL_ENGINE) as excel_file:
+                    if not sheet_name:
+                        # 尝试列出所有工作表
+                        sheet_names = excel_file.sheet_names
+                        
+                        if not sheet_names:
+                            raise ExcelParseError("错误: Excel文件中没有找到工作表")
+                        
+                        # 默认使用第一个工作表
+                        sheet_name = sheet_names[0]
+                    
+                    # 先获取总行数，避免为了校验索引而读取整个工作表
+                    scan = self._scan_rows(excel_file, sheet_name)
+                    if scan is None or not scan[1]:
+                        # 无法逐行统计行数或数据行比表头宽，退回完整读取
+                        df = excel_file.parse(sheet_name)
+                        total_rows = len(df)
+                        if 0 <= row_index < total_rows:
+                            row_df = df.iloc[[row_index]]
+                    else:
+                        total_rows = scan[0]
+                        if 0 <= row_index < total_rows:
+                            # 跳过目标行之前的数据行（保留表头），只解析一行
+                            row_df = excel_file.parse(
+                                sheet_name,
+                                skiprows=range(1, row_index + 1),
+                                nrows=1
+                            )
+                            if len(row_df) == 0:
+                                # 目标行是中间的空行，pandas只读取一行时会把它当作末尾的空行去掉，补回空行
+                                row_df = row_df.reindex([0])
+            except ExcelParseError:
+                raise
+            except Exception as e:
+                raise ExcelParseError(f"读取Excel文件时出错: {str(e)}") from e
+            
+            # 检查工作表是否为空
+            if total_rows == 0:
+                raise ExcelParseError("错误: Excel文件中没有数据")
+                
+            # 检查行索引是否有效
+            if row_index < 0 or row_index >= total_rows:
+                raise ExcelParseError(f"错误: 行索引 {row_index} 超出范围，文件共有 {total_rows} 行数据", total_rows)
+            
+            if len(row_df) == 0 or len(row_df.columns) == 0:
+                raise ExcelParseError("错误: Excel文件中没有数据")
+                
+            # 将单行数据转换为文本格式
+            text_content = self._row_to_text(row_df, row_index)
+            
+            return text_content, total_rows
+        except ExcelParseError:
+            raise
+        except Exception as e:
+            raise ExcelParseError(f"解析Excel行数据时出错: {str(e)}") from e
+    
+    def _get_extension(self, file_path: str) -> str:
+        """
+        获取文件扩展名（含"."，与os.path.splitext的结果一致）
+        
+        Args:
+            file_path: 文件路径
+            
+        Returns:
+            文件扩展名，没有扩展名时返回空字符串
+        """
+        stem, dot, suffix = os.path.basename(file_path).rpartition(".")
+        # 以"."开头的文件名（如".csv"）没有扩展名
+        if not dot or not stem.strip("."):
+            return ""
+        return dot + suffix
+    
+    def _scan_rows(self, excel_file: pd.ExcelFile, sheet_name: str) -> Optional[Tuple[int, bool]]:
+        """
+        统计工作表的数据行数（不含表头），不构建DataFrame（openpyxl逐行扫描单元格值，calamine读取数据范围）
+        
+        不使用工作表尺寸（openpyxl的max_row/calamine的height）：尺寸会包含末尾只有格式的空行，
+        也不反映表头前的空行，与pandas解析出的行数不一致
+        
+        Args:
+            excel_file: 已打开的ExcelFile对象
+            sheet_name: 工作表名称
+            
+        Returns:
+            (数据行数, 表头是否覆盖所有列) 元组，行数与pandas解析出的行数一致；无法逐行扫描时返回None。
+            有数据行比表头宽时，只解析部分行得到的列会比完整解析少，调用方需要完整解析
+        """
+        # 直接复用ExcelFile底层已打开的工作簿逐行读取
+        if excel_file.engine == "calamine":
+            # pandas读取calamine工作表时保留从第一行到数据范围最后一行之间的所有行，并补齐为等宽的行，
+            # 因此数据范围的结束行号（从0开始）就是不含表头的行数
+            end = excel_file.book.get_sheet_by_name(sheet_name).end
+            return (end[0] if end else 0), True
+        if excel_file.engine != "openpyxl":
+            return None
+            
+        sheet = excel_file.book[sheet_name]
+        if excel_file.book.read_only:
+            # 与pandas一致，忽略文件中记录的（可能不准确的）尺寸
+            sheet.reset_dimensions()
+        
+        # 与pandas一致：第一行是表头，去掉末尾的空行和每行末尾的空单元格，中间的空行保留
+        last_index = 0
+        header_width = 0
+        max_width = 0
+        for index, row in enumerate(sheet.iter_rows(values_only=True)):
+            width = len(row)
+            while width and (row[width - 1] is None or row[width - 1] == ""):
+                width -= 1
+            if index == 0:
+                header_width = width
+            if width:
+                last_index = index
+                max_width = max(max_width, width)
+        return last_index, max_width <= header_width
+    
+    def _read_preview(self, excel_file: pd.ExcelFile, sheet_name: str) -> Tuple[pd.DataFrame, int]:
+        """
+        读取工作表中用于预览的前PREVIEW_ROWS行数据
+        
+        Args:
+            excel_file: 已打开的ExcelFile对象
+            sheet_name: 工作表名称
+            
+        Returns:
+            (预览DataFrame, 总数据行数) 元组
+        """
+        scan = self._scan_rows(excel_file, sheet_name)
+        if scan is None or not scan[1]:
+            # 无法逐行统计行数或数据行比表头宽，退回完整读取
+            df = excel_file.parse(sheet_name)
+            return df.head(PREVIEW_ROWS), len(df)
+            
+        # 只解析预览所需的行（pandas读取到足够的行后即停止）
+        total_rows = scan[0]
+        df = excel_file.parse(sheet_name, nrows=PREVIEW_ROWS)
+        preview_rows = min(PREVIEW_ROWS, total_rows)
+        if len(df) < preview_rows:
+            # 预览范围末尾是空行（之后还有数据），pandas只读取部分行时会把它们去掉，补回空行
+            df = df.reindex(range(preview_rows))
+        return df, total_rows
+    
+    def _read_csv_preview(self, csv_path: str) -> Tuple[pd.DataFrame, int]:
+        """
+        分块读取CSV文件，只保留预览所需的前PREVIEW_ROWS行并统计总行数
+        
+        Args:
+            csv_path: CSV文件路径
+            
+        Returns:
+            (预览DataFrame, 总数据行数) 元组
+        """
+        preview = None
+        total_rows = 0
+        with pd.read_csv(csv_path, chunksize=CSV_CHUNK_ROWS) as reader:
+            for chunk in reader:
+                if preview is None:
+                    preview = chunk.head(PREVIEW_ROWS)
+                total_rows += len(chunk)
+                
+        if preview is None:
+            # 只有表头没有数据
+            preview = pd.read_csv(csv_path, nrows=0)
+        return preview, total_rows
+    
+    def _read_csv_row(self, csv_path: str, row_index: int) -> Tuple[Optional[pd.DataFrame], int]:
+        """
+        分块读取CSV文件，取出指定行并统计总行数
+        
+        Args:
+            csv_path: CSV文件路径
+            row_index: 要提取的行索引（0表示第一行数据，不含表头）
+            
+        Returns:
+            (单行DataFrame，行索引无效时为None, 总数据行数) 元组
+        """
+        row_df = None
+        total_rows = 0
+        with pd.read_csv(csv_path, chunksize=CSV_CHUNK_ROWS) as reader:
+            for chunk in reader:
+                if row_df is None and total_rows <= row_index < total_rows + len(chunk):
+                    row_df = chunk.iloc[[row_index - total_rows]]
+                total_rows += len(chunk)
+                
+        return row_df, total_rows
+    
+    def _row_to_text(self, row_df: pd.DataFrame, row_index: int) -> str:
+        """
+        将单行DataFrame转换为文本格式
+        
+        Args:
+            row_df: 包含单行数据的DataFrame
+            row_index: 原始数据中的行索引
+            
+        Returns:
+            文本表示
+        """
+        text_lines = []
+        
+        # 添加基本信息
+        text_lines.append(f"Excel数据 - 第 {row_index+1} 行:")
+        text_lines.append(f"列名: {', '.join(row_df.columns.astype(str))}")
+        text_lines.append("")
+        
+        # 处理行数据：一次性取出唯一一行的值和非空掩码，避免逐列通过Series按标签取值
+        values = row_df.to_numpy(dtype=object)[0]
+        mask = row_df.notna().to_numpy()[0]
+        for col_name, value, present in zip(row_df.columns.tolist(), values, mask):
+            # 跳过NaN值
+            if present:
+                text_lines.append(f"  {col_name}: {self._format_value(value)}")
+        
+        return "\n".join(text_lines)
+    
+    def _format_value(self, value: Any) -> str:
+        """
+        将单个非空单元格的值转换为文本
+        
+        Args:
+            value: 单元格的值
+            
+        Returns:
+            文本表示，整数值的浮点数去掉小数部分
+        """
+        # 布尔值保持True/False，不当作整数处理
+        if isinstance(value, bool):
+            return str(value)
+        # Python和NumPy的整数、浮点数都注册为numbers.Real，统一判断
+        if isinstance(value, numbers.Integral):
+            return str(int(value))
+        if isinstance(value, numbers.Real) and float(value).is_integer():
+            # 整数值的浮点数去掉小数部分
+            return str(int(value))
+        return str(value)
+    
+    def _dataframe_to_text(self, df: pd.DataFrame, total_rows: Optional[int] = None) -> str:
+        """
+        将DataFrame转换为文本格式
+        
+        Args:
+            df: Pandas DataFrame对象
+            total_rows: 原始数据的总行数，df只包含预览行时传入；默认为len(df)
+            
+        Returns:
+            文本表示，每行是"列名: 值"的格式
+            
+        Raises:
+            ExcelParseError: 格式化失败
+        """
+        try:
+            if total_rows is None:
+                total_rows = len(df)
+                
+            text_lines = []
+            
+            # 添加列名作为标题
+            text_lines.append("Excel数据内容：")
+            text_lines.append(f"总行数: {total_rows}")
+            text_lines.append(f"列名: {', '.join(df.columns.astype(str))}")
+            text_lines.append("")
+            
+            # 只展示前PREVIEW_ROWS行，一次性完成所有非空单元格的格式化，避免逐单元格分支判断
+            head = df.head(PREVIEW_ROWS)
+            columns = head.columns.tolist()
+            formatted = head.map(self._format_value, na_action="ignore").to_numpy(dtype=object)
+            mask = head.notna().to_numpy()
+            
+            # 处理每一行数据，跳过NaN值
+            for idx, row_values, row_mask in zip(head.index, formatted, mask):
+                text_lines.append(f"行 {idx+1}:")
+                text_lines.extend(
+                    f"  {col_name}: {value}"
+                    for col_name, value, present in zip(columns, row_values, row_mask)
+                    if present
+                )
+                text_lines.append("")  # 空行分隔每行数据
+                
+            # 如果数据量太大，只展示前PREVIEW_ROWS行
+            if total_rows > len(head):
+                text_lines.append(f"... 已省略剩余 {total_rows - len(head)} 行数据 ...")
+                    
+            return "\n".join(text_lines)
+        except Exception as e:
+            raise ExcelParseError(f"格式化DataFrame时出错: {str(e)}") from e 
\ No newline at end of file
@@ -1,520 +1,853 @@
-import os
-import json
-import requests
-import asyncio
-import aiohttp
-from typing import Dict, Any, Optional
-from config_loader import load_api_config
-import re
-class LLMProcessor:
-    """简单的LLM处理器 - 使用OpenAI API直接与LLM交互"""
-    
-    def __init__(self, api_key: Optional[str] = None, api_base: Optional[str] = None, model_name: Optional[str] = None):
-        """
-        初始化LLM处理器
-        
-        Args:
-            api_key: OpenAI API密钥，如果为None则尝试从环境变量OPENAI_API_KEY或api_config.json获取
-            api_base: API基础URL，如果为None则尝试从api_config.json获取，否则使用OpenAI默认URL
-            model_name: 模型名称，如果为None则尝试从api_config.json获取，否则使用gpt-3.5-turbo
-        """
-        # 加载配置
-        config = load_api_config()
-        
-        # 设置API密钥
-        self.api_key = api_key or os.environ.get("OPENAI_API_KEY") or config.get("OPENAI_API_KEY")
-        if not self.api_key:
-            raise ValueError("未提供API密钥，且环境变量OPENAI_API_KEY和api_config.json中均未设置")
-        
-        # 设置API基础URL
-        self.api_base = api_base or config.get("OPENAI_API_BASE") or "https://api.openai.com/v1"
-        
-        # 设置模型名称
-        self.model_name = model_name or config.get("OPENAI_MODEL_NAME") or config.get("OPENAI_MODEL") or "gpt-3.5-turbo"
-        
-        # 检查是否使用OpenRouter
-        self.is_openrouter = "openrouter.ai" in self.api_base
-        
-        # 初始化提示词
-        self.resume_prompt = None
-        self.offer_prompt = None
-        
-        print(f"LLM配置: API基础URL={self.api_base}, 模型={self.model_name}")
-        print(f"使用OpenRouter API: {self.is_openrouter}")
-        
-    def analyze_resume(self, resume_text: str) -> Dict[str, Any]:
-        """
-        分析简历文本
-        
-        Args:
-            resume_text: 提取的简历文本
-            
-        Returns:
-            分析结果，包含结构化的简历信息
-        """
-        # 调用同步方法
-        return self._call_llm(self._get_resume_prompt(resume_text))
-    
-    async def analyze_resume_async(self, resume_text: str) -> Dict[str, Any]:
-        """
-        异步分析简历文本
-        
-        Args:
-            resume_text: 提取的简历文本
-            
-        Returns:
-            分析结果，包含结构化的简历信息
-        """
-        # 调用异步方法
-        return await self._call_llm_async(self._get_resume_prompt(resume_text))
-    
-    def _get_resume_prompt(self, resume_text: str) -> str:
-        """生成简历分析提示词"""
-        if self.resume_prompt:
-            # 确保resume_prompt中包含占位符，防止错误替换
-            if "{resume_text}" in self.resume_prompt:
-                return self.resume_prompt.replace("{resume_text}", resume_text)
-            else:
-                # 如果没有占位符，则附加简历文本
-                return f"{self.resume_prompt}\n\nResume text:\n{resume_text}"
-        return f"""You are an expert at extracting information from resumes.
-        
-Given the text content of a resume, extract and format the following information as a JSON object.
-You must respond with ONLY the JSON object, no other text.
-
-{{
-    "studentName": "只写姓氏首字母+同学，比如'Z同学'",
-    "education": {{
-        "institution": "学校名称(用中文,如:'北京大学')",
-        "major": "专业名称(用中文,如:'计算机科学与技术')",
-        "gpaValue": "GPA成绩(数字格式,如:3.38)",
-        "gpaOriginal": "原始GPA格式(如:'3.38/4.0')",
-         "institutionType": "院校类型(枚举值:'DOMESTIC_C9','DOMESTIC_985','DOMESTIC_211','DOMESTIC_COOPERATIVE','OVERSEAS_UNIVERSITY','DOMESTIC_UNIVERSITY','HONGKONG_MACAO_TAIWAN', 'OVERSEAS_K12','DOMESTIC_K12')"
-    }},
-    "testScores": [ 
-        {{
-            "testType": "LANGUAGE or STANDARDIZED or OTHER",
-            "testName": "考试名称",
-            "testScore": "总分",
-            "detailScores": {{
-                "分项名称": "分项分数"
-            }}
-        }}
-    ],
-    "experiences": [
-        {{
-            "type": "INTERNSHIP/RESEARCH/COMPETITION/OTHER",
-            "description": "一句话概述经历类型和性质",
-            "organization": "机构档次描述",
-            "role": "担任角色(必填,如果简历中未明确说明,请根据工作内容推断)",
-            "duration": "持续时间",
-            "achievement": "成果描述"
-        }}
-    ]
-}}
-
-Resume text:
-{resume_text}
-
-Please return only the JSON format analysis result without additional explanation text.
-"""
-        
-    def analyze_offer(self, offer_text: str) -> Dict[str, Any]:
-        """
-        分析Offer文本
-        
-        Args:
-            offer_text: 提取的Offer文本
-            
-        Returns:
-            分析结果，包含结构化的Offer信息
-        """
-        # 调用同步方法
-        return self._call_llm(self._get_offer_prompt(offer_text))
-    
-    async def analyze_offer_async(self, offer_text: str) -> Dict[str, Any]:
-        """
-        异步分析Offer文本
-        
-        Args:
-            offer_text: 提取的Offer文本
-            
-        Returns:
-            分析结果，包含结构化的Offer信息
-        """
-        # 调用异步方法
-        return await self._call_llm_async(self._get_offer_prompt(offer_text))
-    
-    def _get_offer_prompt(self, offer_text: str) -> str:
-        """生成Offer分析提示词"""
-        if self.offer_prompt:
-            # 确保offer_prompt中包含占位符，防止错误替换
-            if "{offer_text}" in self.offer_prompt:
-                return self.offer_prompt.replace("{offer_text}", offer_text)
-            else:
-                # 如果没有占位符，则附加Offer文本
-                return f"{self.offer_prompt}\n\nOffer letter text:\n{offer_text}"
-        return f"""You are an expert at extracting information from university admission offer letters and gathering additional program information.
-        
-Follow these steps exactly:
-1. First analyze the offer letter text to extract basic information
-2. Extract rankings if mentioned in the text
-3. Combine all information into a JSON response
-
-The response must be a valid JSON object with this exact structure:
-{{
-    "admissions": [
-        {{
-            "school": "the full university name in English",
-            "country": "学校所在国家(用中文,如:'美国'/'英国'/'新加坡')",
-            "program": "the full program name in English",
-            "majorCategory": "专业类别(用中文,如:'计算机科学'/'工商管理'/'数据科学')",
-            "degreeType": "UNDERGRADUATE/MASTER/PHD/OTHER",
-            "rankingType": "必填，排名类型(美国学校填写'US News',其他学校填写'QS')",
-            "rankingValue": "",
-            "rankingTier": "",
-            "enrollmentSeason": "入学季节(如：Spring/Fall/Summer/Winter 2025)",
-            "hasScholarship": true/false,
-            "scholarshipAmount": "奖学金金额(包含年度信息,如:'$7,000/year'/'￥50,000/semester')",
-            "scholarshipNote": "额外的奖学金说明(如获奖原因、续期条件等)"
-        }}
-    ]
-}}
-
-Offer letter text:
-{offer_text}
-
-Please return only the JSON format analysis result without additional explanation text.
-"""
-    
-    async def process_documents(self, resume_text: str, offer_texts: list) -> Dict[str, Any]:
-        """
-        异步处理所有文档
-        
-        Args:
-            resume_text: 简历文本
-            offer_texts: Offer文本列表
-            
-        Returns:
-            包含简历和所有Offer分析结果的字典
-        """
-        # 创建任务列表
-        tasks = [
-            self.analyze_resume_async(resume_text)
-        ]
-        
-        # 添加所有offer分析任务
-        for offer_text in offer_texts:
-            tasks.append(self.analyze_offer_async(offer_text))
-        
-        # 并行执行所有任务
-        results = await asyncio.gather(*tasks)
-        
-        # 构建结果字典
-        combined_result = {
-            "resume_analysis": results[0],
-            "offer_analyses": results[1:] if len(results) > 1 else []
-        }
-        
-        return combined_result
-        
-    def _call_llm(self, prompt: str) -> Dict[str, Any]:
-        """
-        同步调用LLM API
-        
-        Args:
-            prompt: 提示文本
-            
-        Returns:
-            LLM响应的JSON对象
-        """
-        headers = {
-            "Content-Type": "application/json; charset=utf-8",  # 显式指定UTF-8编码
-            "Authorization": f"Bearer {self.api_key}"
-        }
-        
-        # 添加OpenRouter特有的headers
-        if self.is_openrouter:
-            headers["HTTP-Referer"] = "https://localhost"  # OpenRouter需要的refer头
-            headers["X-Title"] = "ResumeAnalyzer"  # 应用标题
-        
-        # 准备请求数据和API端点
-        data, api_endpoint = self._prepare_request_data(prompt)
-        
-        try:
-            # 打印请求信息
-            print(f"调用LLM API: {api_endpoint}")
-            print(f"使用模型: {self.model_name}")
-            
-            # 显式将数据转换为UTF-8编码的JSON字符串
-            json_data = json.dumps(data, ensure_ascii=False).encode('utf-8')
-            
-            # 使用data参数而不是json参数来发送请求
-            response = requests.post(
-                api_endpoint,
-                headers=headers,
-                data=json_data,  # 使用data参数传递UTF-8编码的JSON
-                timeout=60
-            )
-            
-            # 处理响应
-            return self._process_response(response)
-                
-        except requests.exceptions.Timeout:
-            return {"error": "API请求超时"}
-        except requests.exceptions.ConnectionError:
-            return {"error": "无法连接到API服务器"}
-        except Exception as e:
-            return {"error": f"调用LLM API时出错: {str(e)}"}
-    
-    async def _call_llm_async(self, prompt: str) -> Dict[str, Any]:
-        """
-        异步调用LLM API
-        
-        Args:
-            prompt: 提示文本
-            
-        Returns:
-            LLM响应的JSON对象
-        """
-        headers = {
-            "Content-Type": "application/json; charset=utf-8",  # 显式指定UTF-8编码
-            "Authorization": f"Bearer {self.api_key}"
-        }
-        
-        # 添加OpenRouter特有的headers
-        if self.is_openrouter:
-            headers["HTTP-Referer"] = "https://localhost"  # OpenRouter需要的refer头
-            headers["X-Title"] = "ResumeAnalyzer"  # 应用标题
-        
-        # 准备请求数据和API端点
-        data, api_endpoint = self._prepare_request_data(prompt)
-        
-        try:
-            # 打印请求信息
-            print(f"异步调用LLM API: {api_endpoint}")
-            print(f"使用模型: {self.model_name}")
-            
-            # 显式将数据转换为UTF-8编码的JSON字符串
-            json_data = json.dumps(data, ensure_ascii=False).encode('utf-8')
-            
-            # 异步发送请求
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    api_endpoint,
-                    headers=headers,
-                    data=json_data,  # 使用data参数传递UTF-8编码的JSON
-                    timeout=aiohttp.ClientTimeout(total=60)
-                ) as response:
-                    # 处理响应
-                    if response.status != 200:
-                        return {
-                            "error": f"API请求失败: HTTP {response.status}",
-                            "details": await response.text()
-                        }
-                    
-                    # 解析JSON
-                    result = await response.json()
-                    print(f"API响应状态: {response.status}")
-                    
-                    # 从结果中提取内容
-                    content = self._extract_content_from_result(result)
-                    
-                    # 处理内容
-                    if content is None:
-                        return {
-                            "error": "无法从响应中提取内容",
-                            "raw_response": "响应格式异常"
-                        }
-                    
-                    # 解析JSON内容
-                    return self._parse_content_to_json(content)
-                
-        except asyncio.TimeoutError:
-            return {"error": "API请求超时"}
-        except aiohttp.ClientError:
-            return {"error": "无法连接到API服务器"}
-        except Exception as e:
-            return {"error": f"调用LLM API时出错: {str(e)}"}
-    
-    def _prepare_request_data(self, prompt: str) -> tuple:
-        """准备请求数据和API端点"""
-        if self.is_openrouter:
-            # OpenRouter特定格式
-            data = {
-                "model": self.model_name,
-                "messages": [{"role": "user", "content": prompt}],
-                "temperature": 0,
-                "response_format": {"type": "json_object"}
-            }
-            
-            # 确定API端点
-            if self.api_base.endswith('/v1'):
-                api_endpoint = f"{self.api_base}/chat/completions"
-            else:
-                api_endpoint = self.api_base
-        else:
-            # 标准OpenAI格式
-            data = {
-                "model": self.model_name,
-                "messages": [{"role": "user", "content": prompt}],
-                "temperature": 0,
-                "response_format": {"type": "json_object"}
-            }
-            api_endpoint = f"{self.api_base}/chat/completions"
-        
-        return data, api_endpoint
-    
-    def _process_response(self, response) -> Dict[str, Any]:
-        """处理HTTP响应"""
-        # 检查HTTP错误
-        if response.status_code != 200:
-            return {
-                "error": f"API请求失败: HTTP {response.status_code}",
-                "details": response.text
-            }
-        
-        # 解析JSON
-        result = response.json()
-        print(f"API响应状态: {response.status_code}")
-        
-        # 从结果中提取内容
-        content = self._extract_content_from_result(result)
-        
-        # 处理内容
-        if content is None:
-            return {
-                "error": "无法从响应中提取内容",
-                "raw_response": "响应格式异常"
-            }
-        
-        # 解析JSON内容
-        return self._parse_content_to_json(content)
-    
-    def _extract_content_from_result(self, result) -> Optional[str]:
-        """从API响应结果中提取内容"""
-        content = None
-        
-        # 1. 标准OpenAI格式
-        if "choices" in result and len(result["choices"]) > 0:
-            if "message" in result["choices"][0]:
-                content = result["choices"][0]["message"].get("content")
-            elif "text" in result["choices"][0]:
-                content = result["choices"][0].get("text")
-        
-        # 2. OpenRouter特定格式
-        if content is None and "output" in result:
-            content = result.get("output", {}).get("content")
-        
-        # 3. 直接查找内容
-        if content is None and "content" in result:
-            content = result.get("content")
-        
-        # 4. 检查response字段
-        if content is None and "response" in result:
-            content = result.get("response")
-        
-        return content
-    
-    def _parse_content_to_json(self, content: str) -> Dict[str, Any]:
-        """解析内容为JSON"""
-        try:
-            parsed_json = json.loads(content)
-            print("成功解析JSON响应")
-            return parsed_json
-        except json.JSONDecodeError:
-            # 尝试从文本中提取JSON
-            print("尝试从文本中提取JSON")
-            extracted_json = self._extract_json_from_text(content)
-            try:
-                parsed_json = json.loads(extracted_json)
-                print("成功提取并解析JSON")
-                return parsed_json
-            except Exception as e:
-                return {
-                    "error": "无法将LLM响应解析为JSON",
-                    "raw_content": "格式无效"
-                }
-    
-    def _extract_json_from_text(self, text: str) -> str:
-        """从文本中提取JSON部分"""
-        if text is None:
-            return "{}"
-        
-        # 方法1: 寻找```json ... ``` 格式的代码块
-        json_code_block_pattern = re.compile(r'```(?:json)?\s*\n(.*?)\n```', re.DOTALL)
-        matches = json_code_block_pattern.findall(text)
-        
-        if matches:
-            # 找到了代码块，尝试解析最后一个（通常是修正后的）
-            for potential_json in reversed(matches):
-                try:
-                    # 尝试解析找到的代码块
-                    json.loads(potential_json.strip())
-                    print("从代码块中提取到有效JSON")
-                    return potential_json.strip()
-                except json.JSONDecodeError:
-                    # 这个代码块不是有效JSON，继续尝试
-                    continue
-        
-        # 方法2: 寻找文本中的JSON格式内容 (使用正则表达式查找嵌套的{}结构)
-        try:
-            # 特殊情况：如果文本中有多个无嵌套的JSON对象，找出最长的一个
-            json_pattern = re.compile(r'(\{(?:[^{}]|(?:\{(?:[^{}]|(?:\{[^{}]*\}))*\}))*\})')
-            json_candidates = json_pattern.findall(text)
-            
-            if json_candidates:
-                # 按长度排序，优先尝试最长的可能JSON
-                json_candidates.sort(key=len, reverse=True)
-                
-                for candidate in json_candidates:
-                    try:
-                        json.loads(candidate)
-                        print(f"从正则表达式找到有效JSON，长度：{len(candidate)}")
-                        return candidate
-                    except:
-                        continue
-        except Exception as e:
-            print(f"正则提取JSON发生错误: {str(e)}")
-        
-        # 方法3: 寻找第一个{和最后一个}，提取中间部分
-        start = text.find("{")
-        end = text.rfind("}")
-        
-        if start != -1 and end != -1 and end > start:
-            try:
-                json_text = text[start:end+1]
-                # 验证提取的内容是否可以解析为JSON
-                json.loads(json_text)
-                print(f"从文本中提取到完整JSON，长度: {len(json_text)}")
-                return json_text
-            except json.JSONDecodeError:
-                # 尝试进一步处理和修复JSON
-                pass
-        
-        # 方法4: 尝试通过行解析来提取JSON结构
-        lines = text.split('\n')
-        json_lines = []
-        json_started = False
-        
-        for line in lines:
-            line = line.strip()
-            if not json_started and line.startswith('{'):
-                json_started = True
-                json_lines.append(line)
-            elif json_started:
-                json_lines.append(line)
-                if line.endswith('}'):
-                    # 可能找到了完整的JSON
-                    try:
-                        json_text = '\n'.join(json_lines)
-                        json.loads(json_text)
-                        print(f"通过逐行解析找到有效JSON，长度: {len(json_text)}")
-                        return json_text
-                    except:
-                        # 继续寻找结束括号
-                        continue
-        # 返回空JSON对象作为后备
-        print("无法提取有效JSON，返回空对象")
-        return "{}"
+from __future__ import annotations
+
+import os
+import json
+import asyncio
+import concurrent.futures
+import copy
+import functools
+import hashlib
+import random
+import threading
+import weakref
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Callable, Dict, Any, List, Optional, Tuple
+from config_loader import load_api_config
+import re
+
+if TYPE_CHECKING:
+    import aiohttp
+else:
+    # aiohttp只在真正发送请求时才需要，首次请求时再导入，见_import_aiohttp()
+    aiohttp = None
+
+def _import_aiohttp():
+    """首次调用时导入aiohttp并缓存到模块全局变量"""
+    global aiohttp
+    if aiohttp is None:
+        import aiohttp as aiohttp_module
+        aiohttp = aiohttp_module
+    return aiohttp
+
+# 优先使用orjson序列化/解析JSON（C实现，且直接输出UTF-8字节），未安装时退回标准库
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(data: Any) -> bytes:
+        return json.dumps(data, ensure_ascii=False).encode('utf-8')
+    _json_loads = json.loads
+
+# 从LLM响应中提取JSON时使用的正则表达式（模块加载时编译一次）
+_JSON_CODE_BLOCK_RE = re.compile(r'```(?:json)?\s*\n(.*?)\n```', re.DOTALL)
+
+# 默认提示词模板，按文本占位符的位置拆分为前后两段常量，生成提示词时只需拼接一次
+_RESUME_PROMPT_PREFIX = """You are an expert at extracting information from resumes.
+        
+Given the text content of a resume, extract and format the following information as a JSON object.
+You must respond with ONLY the JSON object, no other text.
+
+{
+    "studentName": "只写姓氏首字母+同学，比如'Z同学'",
+    "education": {
+        "institution": "学校名称(用中文,如:'北京大学')",
+        "major": "专业名称(用中文,如:'计算机科学与技术')",
+        "gpaValue": "GPA成绩(数字格式,如:3.38)",
+        "gpaOriginal": "原始GPA格式(如:'3.38/4.0')",
+         "institutionType": "院校类型(枚举值:'DOMESTIC_C9','DOMESTIC_985','DOMESTIC_211','DOMESTIC_COOPERATIVE','OVERSEAS_UNIVERSITY','DOMESTIC_UNIVERSITY','HONGKONG_MACAO_TAIWAN', 'OVERSEAS_K12','DOMESTIC_K12')"
+    },
+    "testScores": [ 
+        {
+            "testType": "LANGUAGE or STANDARDIZED or OTHER",
+            "testName": "考试名称",
+            "testScore": "总分",
+            "detailScores": {
+                "分项名称": "分项分数"
+            }
+        }
+    ],
+    "experiences": [
+        {
+            "type": "INTERNSHIP/RESEARCH/COMPETITION/OTHER",
+            "description": "一句话概述经历类型和性质",
+            "organization": "机构档次描述",
+            "role": "担任角色(必填,如果简历中未明确说明,请根据工作内容推断)",
+            "duration": "持续时间",
+            "achievement": "成果描述"
+        }
+    ]
+}
+
+Resume text:
+"""
+_RESUME_PROMPT_SUFFIX = """
+
+Please return only the JSON format analysis result without additional explanation text.
+"""
+
+_OFFER_PROMPT_PREFIX = """You are an expert at extracting information from university admission offer letters and gathering additional program information.
+        
+Follow these steps exactly:
+1. First analyze the offer letter text to extract basic information
+2. Extract rankings if mentioned in the text
+3. Combine all information into a JSON response
+
+The response must be a valid JSON object with this exact structure:
+{
+    "admissions": [
+        {
+            "school": "the full university name in English",
+            "country": "学校所在国家(用中文,如:'美国'/'英国'/'新加坡')",
+            "program": "the full program name in English",
+            "majorCategory": "专业类别(用中文,如:'计算机科学'/'工商管理'/'数据科学')",
+            "degreeType": "UNDERGRADUATE/MASTER/PHD/OTHER",
+            "rankingType": "必填，排名类型(美国学校填写'US News',其他学校填写'QS')",
+            "rankingValue": "",
+            "rankingTier": "",
+            "enrollmentSeason": "入学季节(如：Spring/Fall/Summer/Winter 2025)",
+            "hasScholarship": true/false,
+            "scholarshipAmount": "奖学金金额(包含年度信息,如:'$7,000/year'/'￥50,000/semester')",
+            "scholarshipNote": "额外的奖学金说明(如获奖原因、续期条件等)"
+        }
+    ]
+}
+
+Offer letter text:
+"""
+_OFFER_PROMPT_SUFFIX = """
+
+Please return only the JSON format analysis result without additional explanation text.
+"""
+
+# 多个Offer合并为一次请求时追加的说明，要求按顺序返回每个Offer的分析结果
+_OFFER_BATCH_INSTRUCTION = """
+
+The offer letter text above contains {count} separate offer letters, labelled OFFER 1 to OFFER {count}.
+Analyze each offer letter independently and return a single JSON object of the form:
+{{"offers": [<analysis of OFFER 1>, <analysis of OFFER 2>, ...]}}
+The "offers" array must contain exactly {count} items in the same order as the offer letters, and each item must use the JSON structure described above.
+"""
+
+@functools.lru_cache(maxsize=32)
+def _split_prompt(prompt: Optional[str], placeholder: str, text_label: str,
+                  default_parts: Tuple[str, str]) -> Tuple[str, ...]:
+    """
+    按占位符把提示词模板拆分为若干段，生成提示词时用文本拼接各段即可，不必每次扫描模板
+    （结果按模板缓存，同一模板在多次调用间只拆分一次）
+    
+    Args:
+        prompt: 提示词模板，为空时使用默认模板
+        placeholder: 文本占位符
+        text_label: 模板中没有占位符时，附加在模板末尾、文本之前的标签
+        default_parts: 默认模板按占位符拆分后的前后两段
+        
+    Returns:
+        拆分后的模板片段
+    """
+    if not prompt:
+        return default_parts
+    # 确保模板中包含占位符，防止错误替换
+    if placeholder in prompt:
+        return tuple(prompt.split(placeholder))
+    # 如果没有占位符，则附加文本
+    return (f"{prompt}\n\n{text_label}\n", "")
+
+def _split_resume_prompt(prompt: Optional[str]) -> Tuple[str, ...]:
+    """按{resume_text}占位符拆分简历分析提示词模板"""
+    return _split_prompt(prompt, "{resume_text}", "Resume text:", (_RESUME_PROMPT_PREFIX, _RESUME_PROMPT_SUFFIX))
+
+def _split_offer_prompt(prompt: Optional[str]) -> Tuple[str, ...]:
+    """按{offer_text}占位符拆分Offer分析提示词模板"""
+    return _split_prompt(prompt, "{offer_text}", "Offer letter text:", (_OFFER_PROMPT_PREFIX, _OFFER_PROMPT_SUFFIX))
+
+def _scan_json_candidates(text: str) -> List[Tuple[int, int]]:
+    """
+    线性扫描文本，找出所有成对的{}区间（忽略JSON字符串内的括号）
+    
+    相比嵌套正则表达式，扫描只遍历一次文本，不会发生回溯，且不限制嵌套层数。
+    
+    Args:
+        text: 待扫描的文本
+        
+    Returns:
+        (起始位置, 结束位置) 列表，按区间长度从长到短排序
+    """
+    candidates = []
+    open_positions = []  # 尚未闭合的{的位置
+    in_string = False
+    escape = False
+    
+    for i, char in enumerate(text):
+        if in_string:
+            if escape:
+                escape = False
+            elif char == "\\":
+                escape = True
+            elif char == '"':
+                in_string = False
+        elif char == "{":
+            open_positions.append(i)
+        elif char == "}":
+            if open_positions:
+                candidates.append((open_positions.pop(), i + 1))
+        elif char == '"' and open_positions:
+            # 只有在{}内部才把引号视为JSON字符串的开始
+            in_string = True
+    
+    candidates.sort(key=lambda span: span[1] - span[0], reverse=True)
+    return candidates
+
+class LLMProcessor:
+    """简单的LLM处理器 - 使用OpenAI API直接与LLM交互"""
+    
+    def __init__(self, api_key: Optional[str] = None, api_base: Optional[str] = None, model_name: Optional[str] = None):
+        """
+        初始化LLM处理器
+        
+        Args:
+            api_key: OpenAI API密钥，如果为None则尝试从环境变量OPENAI_API_KEY或api_config.json获取
+            api_base: API基础URL，如果为None则尝试从api_config.json获取，否则使用OpenAI默认URL
+            model_name: 模型名称，如果为None则尝试从api_config.json获取，否则使用gpt-3.5-turbo
+        """
+        # 加载配置
+        config = load_api_config()
+        
+        # 设置API密钥
+        self.api_key = api_key or os.environ.get("OPENAI_API_KEY") or config.get("OPENAI_API_KEY")
+        if not self.api_key:
+            raise ValueError("未提供API密钥，且环境变量OPENAI_API_KEY和api_config.json中均未设置")
+        
+        # 设置API基础URL
+        self.api_base = api_base or config.get("OPENAI_API_BASE") or "https://api.openai.com/v1"
+        
+        # 设置模型名称
+        self.model_name = model_name or config.get("OPENAI_MODEL_NAME") or config.get("OPENAI_MODEL") or "gpt-3.5-turbo"
+        
+        # 检查是否使用OpenRouter
+        self.is_openrouter = "openrouter.ai" in self.api_base
+        
+        # 请求头、请求体公共字段和API端点在多次调用间不变，初始化时计算一次
+        self._headers = {
+            "Content-Type": "application/json; charset=utf-8",  # 显式指定UTF-8编码
+            "Authorization": f"Bearer {self.api_key}"
+        }
+        if self.is_openrouter:
+            # 添加OpenRouter特有的headers
+            self._headers["HTTP-Referer"] = "https://localhost"  # OpenRouter需要的refer头
+            self._headers["X-Title"] = "ResumeAnalyzer"  # 应用标题
+        
+        # OpenRouter和标准OpenAI的请求体格式相同
+        self._base_payload = {
+            "model": self.model_name,
+            "temperature": 0,
+            "response_format": {"type": "json_object"}
+        }
+        
+        # 确定API端点：OpenRouter的基础URL不以/v1结尾时直接作为端点使用
+        if self.is_openrouter and not self.api_base.endswith('/v1'):
+            self._api_endpoint = self.api_base
+        else:
+            self._api_endpoint = f"{self.api_base}/chat/completions"
+        
+        # 初始化提示词（通过属性设置，同时生成拆分后的模板片段）
+        self.resume_prompt = None
+        self.offer_prompt = None
+        
+        # 并行分析文档时同时进行的最大请求数，可通过环境变量LLM_CONCURRENCY调整
+        try:
+            self.max_concurrent_requests = max(1, int(os.environ.get("LLM_CONCURRENCY", "8")))
+        except ValueError:
+            self.max_concurrent_requests = 8
+        
+        # 触发速率限制(HTTP 429)时的最大重试次数和指数退避的基础等待秒数
+        self.max_retries = 3
+        self.retry_base_delay = 1.0
+        
+        # LLM结果缓存（按模型名和提示词哈希索引，超出容量时淘汰最久未使用的结果）
+        self.result_cache_size = 128
+        self._result_cache: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+        # 处理器可能被多个线程共享（如streamlit的cache_resource），缓存的读写需要加锁
+        self._result_cache_lock = threading.Lock()
+        
+        # 异步HTTP会话按事件循环分别保存（会话与创建它的事件循环绑定），
+        # 同一事件循环内的多次调用复用连接池，多个线程各自运行事件循环时互不覆盖
+        self._sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = weakref.WeakKeyDictionary()
+        
+        print(f"LLM配置: API基础URL={self.api_base}, 模型={self.model_name}")
+        print(f"使用OpenRouter API: {self.is_openrouter}")
+        
+    def analyze_resume(self, resume_text: str, resume_prompt: Optional[str] = None) -> Dict[str, Any]:
+        """
+        分析简历文本
+        
+        Args:
+            resume_text: 提取的简历文本
+            resume_prompt: 本次使用的提示词模板，为None时使用处理器上设置的模板
+            
+        Returns:
+            分析结果，包含结构化的简历信息
+        """
+        # 调用同步方法
+        return self._call_llm(self._get_resume_prompt(resume_text, resume_prompt))
+    
+    async def analyze_resume_async(self, resume_text: str, resume_prompt: Optional[str] = None) -> Dict[str, Any]:
+        """
+        异步分析简历文本
+        
+        Args:
+            resume_text: 提取的简历文本
+            resume_prompt: 本次使用的提示词模板，为None时使用处理器上设置的模板
+            
+        Returns:
+            分析结果，包含结构化的简历信息
+        """
+        # 调用异步方法
+        return await self._call_llm_async(self._get_resume_prompt(resume_text, resume_prompt))
+    
+    @property
+    def resume_prompt(self) -> Optional[str]:
+        """简历分析提示词模板，设置时预先按{resume_text}占位符拆分"""
+        return self._resume_prompt
+    
+    @resume_prompt.setter
+    def resume_prompt(self, prompt: Optional[str]) -> None:
+        self._resume_prompt = prompt
+        self._resume_prompt_parts = _split_resume_prompt(prompt)
+    
+    @property
+    def offer_prompt(self) -> Optional[str]:
+        """Offer分析提示词模板，设置时预先按{offer_text}占位符拆分"""
+        return self._offer_prompt
+    
+    @offer_prompt.setter
+    def offer_prompt(self, prompt: Optional[str]) -> None:
+        self._offer_prompt = prompt
+        self._offer_prompt_parts = _split_offer_prompt(prompt)
+    
+    def _get_resume_prompt(self, resume_text: str, resume_prompt: Optional[str] = None) -> str:
+        """生成简历分析提示词，指定模板时使用该模板，否则使用处理器上预先拆分的模板"""
+        parts = self._resume_prompt_parts if resume_prompt is None else _split_resume_prompt(resume_prompt)
+        return resume_text.join(parts)
+        
+    def analyze_offer(self, offer_text: str, offer_prompt: Optional[str] = None) -> Dict[str, Any]:
+        """
+        分析Offer文本
+        
+        Args:
+            offer_text: 提取的Offer文本
+            offer_prompt: 本次使用的提示词模板，为None时使用处理器上设置的模板
+            
+        Returns:
+            分析结果，包含结构化的Offer信息
+        """
+        # 调用同步方法
+        return self._call_llm(self._get_offer_prompt(offer_text, offer_prompt))
+    
+    async def analyze_offer_async(self, offer_text: str, offer_prompt: Optional[str] = None) -> Dict[str, Any]:
+        """
+        异步分析Offer文本
+        
+        Args:
+            offer_text: 提取的Offer文本
+            offer_prompt: 本次使用的提示词模板，为None时使用处理器上设置的模板
+            
+        Returns:
+            分析结果，包含结构化的Offer信息
+        """
+        # 调用异步方法
+        return await self._call_llm_async(self._get_offer_prompt(offer_text, offer_prompt))
+    
+    def _get_offer_prompt(self, offer_text: str, offer_prompt: Optional[str] = None) -> str:
+        """生成Offer分析提示词，指定模板时使用该模板，否则使用处理器上预先拆分的模板"""
+        parts = self._offer_prompt_parts if offer_prompt is None else _split_offer_prompt(offer_prompt)
+        return offer_text.join(parts)
+    
+    def _get_offers_batch_prompt(self, offer_texts: List[str], offer_prompt: Optional[str] = None) -> str:
+        """生成将多个Offer合并分析的提示词"""
+        combined_text = "\n\n".join(
+            f"OFFER {index}:\n{offer_text}" for index, offer_text in enumerate(offer_texts, 1)
+        )
+        return (self._get_offer_prompt(combined_text, offer_prompt)
+                + _OFFER_BATCH_INSTRUCTION.format(count=len(offer_texts)))
+    
+    async def analyze_offers_batched_async(self, offer_texts: List[str],
+                                           offer_prompt: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        异步分析多个Offer文本，合并为一次LLM请求以减少请求次数和重复的提示词
+        
+        Args:
+            offer_texts: 提取的Offer文本列表
+            offer_prompt: 本次使用的提示词模板，为None时使用处理器上设置的模板
+            
+        Returns:
+            与offer_texts一一对应的分析结果列表
+        """
+        if len(offer_texts) == 1:
+            return [await self.analyze_offer_async(offer_texts[0], offer_prompt)]
+        
+        def is_valid_batch(result: Any) -> bool:
+            # "offers"必须是与输入数量相同的对象列表，格式不符的回复不缓存
+            offers = result.get("offers") if isinstance(result, dict) else None
+            return (isinstance(offers, list) and len(offers) == len(offer_texts)
+                    and all(isinstance(offer, dict) for offer in offers))
+        
+        result = await self._call_llm_async(
+            self._get_offers_batch_prompt(offer_texts, offer_prompt), validate=is_valid_batch
+        )
+        if is_valid_batch(result):
+            return result["offers"]
+        
+        # 合并请求失败或返回的结果数量不符时，退回逐个分析
+        print("合并分析Offer失败，改为逐个分析")
+        results = await asyncio.gather(
+            *(self.analyze_offer_async(offer_text, offer_prompt) for offer_text in offer_texts),
+            return_exceptions=True
+        )
+        return [
+            {"error": f"调用LLM API时出错: {str(result)}"} if isinstance(result, Exception) else result
+            for result in results
+        ]
+    
+    async def process_documents(self, resume_text: str, offer_texts: list,
+                                offer_batch_size: int = 1,
+                                resume_prompt: Optional[str] = None,
+                                offer_prompt: Optional[str] = None) -> Dict[str, Any]:
+        """
+        异步处理所有文档
+        
+        Args:
+            resume_text: 简历文本
+            offer_texts: Offer文本列表
+            offer_batch_size: 每次LLM请求合并分析的Offer数量，为1时逐个分析
+            resume_prompt: 本次使用的简历提示词模板，为None时使用处理器上设置的模板
+            offer_prompt: 本次使用的Offer提示词模板，为None时使用处理器上设置的模板
+            
+        Returns:
+            包含简历和所有Offer分析结果的字典
+        """
+        # 创建任务列表：简历分析任务在前，之后是所有offer分析任务
+        offer_tasks, offer_batches = self._create_offer_tasks(offer_texts, offer_batch_size, offer_prompt)
+        results = await self._gather_limited(
+            [self.analyze_resume_async(resume_text, resume_prompt)] + offer_tasks
+        )
+        
+        # 构建结果字典
+        combined_result = {
+            "resume_analysis": results[0],
+            "offer_analyses": self._flatten_offer_results(results[1:], offer_batches)
+        }
+        
+        return combined_result
+    
+    async def analyze_offers_async(self, offer_texts: list, offer_batch_size: int = 1,
+                                   offer_prompt: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        异步并行分析所有Offer（不分析简历）
+        
+        Args:
+            offer_texts: Offer文本列表
+            offer_batch_size: 每次LLM请求合并分析的Offer数量，为1时逐个分析
+            offer_prompt: 本次使用的Offer提示词模板，为None时使用处理器上设置的模板
+            
+        Returns:
+            与offer_texts一一对应的分析结果列表
+        """
+        offer_tasks, offer_batches = self._create_offer_tasks(offer_texts, offer_batch_size, offer_prompt)
+        return self._flatten_offer_results(await self._gather_limited(offer_tasks), offer_batches)
+    
+    def _create_offer_tasks(self, offer_texts: list, offer_batch_size: int,
+                            offer_prompt: Optional[str]) -> Tuple[list, List[list]]:
+        """
+        创建offer分析任务，每个任务分析一批Offer
+        
+        Returns:
+            (任务列表, 合并分析时每个任务对应的Offer批次；逐个分析时为空列表) 元组
+        """
+        if offer_batch_size > 1:
+            offer_batches = [
+                offer_texts[start:start + offer_batch_size]
+                for start in range(0, len(offer_texts), offer_batch_size)
+            ]
+            tasks = [self.analyze_offers_batched_async(offer_batch, offer_prompt) for offer_batch in offer_batches]
+            return tasks, offer_batches
+        return [self.analyze_offer_async(offer_text, offer_prompt) for offer_text in offer_texts], []
+    
+    @staticmethod
+    def _flatten_offer_results(offer_results: list, offer_batches: List[list]) -> List[Dict[str, Any]]:
+        """合并分析时每个任务返回一批结果，展开为与offer_texts一一对应的列表"""
+        if not offer_batches:
+            return offer_results
+        return [
+            analysis
+            for batch_result, offer_batch in zip(offer_results, offer_batches)
+            for analysis in (batch_result if isinstance(batch_result, list) else [batch_result] * len(offer_batch))
+        ]
+    
+    async def _gather_limited(self, tasks: list) -> list:
+        """
+        限制并发数并行执行所有任务，单个任务失败不影响其他任务
+        
+        Args:
+            tasks: 协程列表
+            
+        Returns:
+            与tasks一一对应的结果列表，异常转换为包含error字段的字典
+        """
+        # 提前创建共享会话，保证所有并行请求复用同一个连接池；
+        # 如果会话是本次调用创建的，处理完成后关闭，避免事件循环结束时遗留未关闭的连接
+        owns_session = not self._has_live_session()
+        await self._get_session()
+        
+        # 限制同时进行的请求数，避免Offer较多时触发API的速率限制
+        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        
+        async def run_limited(task):
+            async with semaphore:
+                return await task
+        
+        try:
+            results = await asyncio.gather(
+                *(run_limited(task) for task in tasks),
+                return_exceptions=True
+            )
+        finally:
+            if owns_session:
+                await self.aclose()
+        
+        # 将异常转换为与其他错误一致的结果格式
+        return [
+            {"error": f"调用LLM API时出错: {str(result)}"} if isinstance(result, Exception) else result
+            for result in results
+        ]
+        
+    def _call_llm(self, prompt: str) -> Dict[str, Any]:
+        """
+        同步调用LLM API（在独立的事件循环中执行异步调用）
+        
+        Args:
+            prompt: 提示文本
+            
+        Returns:
+            LLM响应的JSON对象
+        """
+        async def call_once() -> Dict[str, Any]:
+            # 独立事件循环结束前关闭本次创建的会话
+            async with self:
+                return await self._call_llm_async(prompt)
+        
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # 当前线程没有运行中的事件循环，直接运行
+            return asyncio.run(call_once())
+        
+        # 已处于事件循环中（不能嵌套asyncio.run），在单独线程中运行
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, call_once()).result()
+    
+    async def _call_llm_async(self, prompt: str, no_cache: bool = False,
+                              validate: Optional[Callable[[Any], bool]] = None) -> Dict[str, Any]:
+        """
+        异步调用LLM API，相同模型和提示词的成功结果会被缓存
+        
+        Args:
+            prompt: 提示文本
+            no_cache: 为True时跳过缓存，强制重新请求
+            validate: 检查结果格式的函数，指定时只缓存通过检查的结果
+            
+        Returns:
+            LLM响应的JSON对象
+        """
+        # temperature=0，相同提示词的结果可以直接复用
+        cache_key = (self.model_name, hashlib.blake2b(prompt.encode('utf-8'), digest_size=16).hexdigest())
+        if not no_cache:
+            with self._result_cache_lock:
+                cached = self._result_cache.get(cache_key)
+                if cached is not None:
+                    self._result_cache.move_to_end(cache_key)
+            if cached is not None:
+                print("命中LLM结果缓存")
+                # 返回副本，避免调用方修改缓存中的结果
+                return copy.deepcopy(cached)
+        
+        result = await self._request_llm(prompt)
+        
+        # 只缓存成功的结果（无法解析出JSON时返回的空对象不缓存，下次调用重新请求）
+        if (isinstance(result, dict) and result and "error" not in result
+                and (validate is None or validate(result))):
+            cached = copy.deepcopy(result)
+            with self._result_cache_lock:
+                self._result_cache[cache_key] = cached
+                self._result_cache.move_to_end(cache_key)
+                while len(self._result_cache) > self.result_cache_size:
+                    self._result_cache.popitem(last=False)
+        
+        return result
+    
+    async def _request_llm(self, prompt: str) -> Dict[str, Any]:
+        """
+        发送LLM API请求
+        
+        Args:
+            prompt: 提示文本
+            
+        Returns:
+            LLM响应的JSON对象
+        """
+        # 确保aiohttp已导入（下方的异常处理也依赖它）
+        _import_aiohttp()
+        
+        # 准备请求数据和API端点
+        data, api_endpoint = self._prepare_request_data(prompt)
+        
+        try:
+            # 打印请求信息
+            print(f"异步调用LLM API: {api_endpoint}")
+            print(f"使用模型: {self.model_name}")
+            
+            # 显式将数据转换为UTF-8编码的JSON字节串
+            json_data = _json_dumps(data)
+            
+            # 异步发送请求（复用共享会话），被限流时按指数退避重试
+            session = await self._get_session()
+            for attempt in range(self.max_retries + 1):
+                async with session.post(
+                    api_endpoint,
+                    headers=self._headers,
+                    data=json_data  # 使用data参数传递UTF-8编码的JSON
+                ) as response:
+                    if response.status != 429 or attempt == self.max_retries:
+                        return await self._handle_response(response)
+                    delay = self._get_retry_delay(response.headers.get("Retry-After"), attempt)
+                
+                # 在释放连接后再等待，避免等待期间占用连接池
+                print(f"API请求被限流(HTTP 429)，{delay:.1f}秒后第{attempt + 1}次重试")
+                await asyncio.sleep(delay)
+            
+        except asyncio.TimeoutError:
+            return {"error": "API请求超时"}
+        except aiohttp.ClientError:
+            return {"error": "无法连接到API服务器"}
+        except Exception as e:
+            return {"error": f"调用LLM API时出错: {str(e)}"}
+    
+    async def _handle_response(self, response: aiohttp.ClientResponse) -> Dict[str, Any]:
+        """
+        处理API响应
+        
+        Args:
+            response: aiohttp响应对象
+            
+        Returns:
+            LLM响应的JSON对象，失败时返回包含error字段的字典
+        """
+        if response.status != 200:
+            return {
+                "error": f"API请求失败: HTTP {response.status}",
+                "details": await response.text()
+            }
+        
+        # 解析JSON（直接解析响应字节，省去解码为str的步骤）
+        result = _json_loads(await response.read())
+        print(f"API响应状态: {response.status}")
+        
+        # 从结果中提取内容
+        content = self._extract_content_from_result(result)
+        
+        # 处理内容
+        if content is None:
+            return {
+                "error": "无法从响应中提取内容",
+                "raw_response": "响应格式异常"
+            }
+        
+        # 解析JSON内容
+        return self._parse_content_to_json(content)
+    
+    def _get_retry_delay(self, retry_after: Optional[str], attempt: int) -> float:
+        """
+        计算限流后的重试等待时间，优先使用服务端返回的Retry-After
+        
+        Args:
+            retry_after: Retry-After响应头（秒数），可能为None
+            attempt: 已重试次数（从0开始）
+            
+        Returns:
+            等待秒数
+        """
+        if retry_after:
+            try:
+                return min(max(float(retry_after), 0.0), 60.0)
+            except ValueError:
+                pass
+        # 指数退避并加入随机抖动，避免并行请求同时重试
+        return self.retry_base_delay * (2 ** attempt) + random.uniform(0, self.retry_base_delay)
+    
+    def _has_live_session(self) -> bool:
+        """当前事件循环下是否已有可用的共享会话"""
+        session = self._sessions.get(asyncio.get_running_loop())
+        return session is not None and not session.closed
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        获取当前事件循环下共享的aiohttp会话，不存在或已失效时重新创建
+        
+        Returns:
+            aiohttp.ClientSession对象
+        """
+        _import_aiohttp()
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            # 会话与事件循环绑定，每个事件循环（如每次asyncio.run、每个线程）使用自己的会话
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=60)
+            )
+            self._sessions[loop] = session
+        return session
+    
+    async def aclose(self) -> None:
+        """关闭当前事件循环下的共享aiohttp会话，释放连接池（不影响其他事件循环的会话）"""
+        session = self._sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None and not session.closed:
+            await session.close()
+    
+    async def __aenter__(self) -> "LLMProcessor":
+        """在async with块内保持共享会话，块内的多次调用复用同一个连接池"""
+        await self._get_session()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+    
+    def _prepare_request_data(self, prompt: str) -> tuple:
+        """准备请求数据和API端点（只有消息内容随调用变化，其余字段在初始化时已确定）"""
+        data = {**self._base_payload, "messages": [{"role": "user", "content": prompt}]}
+        return data, self._api_endpoint
+    
+    def _extract_content_from_result(self, result) -> Optional[str]:
+        """从API响应结果中提取内容"""
+        content = None
+        
+        # 1. 标准OpenAI格式
+        if "choices" in result and len(result["choices"]) > 0:
+            if "message" in result["choices"][0]:
+                content = result["choices"][0]["message"].get("content")
+            elif "text" in result["choices"][0]:
+                content = result["choices"][0].get("text")
+        
+        # 2. OpenRouter特定格式
+        if content is None and "output" in result:
+            content = result.get("output", {}).get("content")
+        
+        # 3. 直接查找内容
+        if content is None and "content" in result:
+            content = result.get("content")
+        
+        # 4. 检查response字段
+        if content is None and "response" in result:
+            content = result.get("response")
+        
+        return content
+    
+    def _parse_content_to_json(self, content: str) -> Dict[str, Any]:
+        """解析内容为JSON"""
+        try:
+            parsed_json = _json_loads(content)
+            print("成功解析JSON响应")
+            return parsed_json
+        except json.JSONDecodeError:
+            # 尝试从文本中提取JSON
+            print("尝试从文本中提取JSON")
+            parsed_json = self._extract_json_from_text(content)
+            if parsed_json is None:
+                # 返回空JSON对象作为后备
+                print("无法提取有效JSON，返回空对象")
+                return {}
+            print("成功提取并解析JSON")
+            return parsed_json
+    
+    def _extract_json_from_text(self, text: str) -> Optional[Any]:
+        """
+        从文本中提取JSON部分
+        
+        Args:
+            text: LLM返回的原始文本
+            
+        Returns:
+            已解析的JSON对象（验证时解析的结果直接返回，调用方无需再次解析），找不到有效JSON时返回None
+        """
+        if text is None:
+            return None
+        
+        # 方法1（快速路径）: 寻找第一个{和最后一个}，提取中间部分
+        # 常见情况下模型返回的JSON只带少量前后缀文本，这一步即可成功，无需后续扫描
+        start = text.find("{")
+        end = text.rfind("}")
+        
+        if start != -1 and end != -1 and end > start:
+            try:
+                json_text = text[start:end+1]
+                # 解析提取的内容
+                parsed_json = _json_loads(json_text)
+                print(f"从文本中提取到完整JSON，长度: {len(json_text)}")
+                return parsed_json
+            except json.JSONDecodeError:
+                # 尝试后续方法提取JSON
+                pass
+        
+        # 方法2: 寻找```json ... ``` 格式的代码块
+        matches = _JSON_CODE_BLOCK_RE.findall(text)
+        
+        if matches:
+            # 找到了代码块，尝试解析最后一个（通常是修正后的）
+            for potential_json in reversed(matches):
+                try:
+                    # 尝试解析找到的代码块
+                    parsed_json = _json_loads(potential_json.strip())
+                    print("从代码块中提取到有效JSON")
+                    return parsed_json
+                except json.JSONDecodeError:
+                    # 这个代码块不是有效JSON，继续尝试
+                    continue
+        
+        # 方法3: 线性扫描文本中成对的{}结构，找出所有可能的JSON对象
+        try:
+            # 按长度从长到短尝试，优先返回最完整的JSON
+            for start, end in _scan_json_candidates(text):
+                candidate = text[start:end]
+                try:
+                    parsed_json = _json_loads(candidate)
+                    print(f"通过括号扫描找到有效JSON，长度：{len(candidate)}")
+                    return parsed_json
+                except json.JSONDecodeError:
+                    continue
+        except Exception as e:
+            print(f"扫描提取JSON发生错误: {str(e)}")
+        
+        # 方法4: 尝试通过行解析来提取JSON结构
+        lines = text.split('\n')
+        json_lines = []
+        json_started = False
+        
+        for line in lines:
+            line = line.strip()
+            if not json_started and line.startswith('{'):
+                json_started = True
+                json_lines.append(line)
+            elif json_started:
+                json_lines.append(line)
+                if line.endswith('}'):
+                    # 可能找到了完整的JSON
+                    try:
+                        json_text = '\n'.join(json_lines)
+                        parsed_json = _json_loads(json_text)
+                        print(f"通过逐行解析找到有效JSON，长度: {len(json_text)}")
+                        return parsed_json
+                    except:
+                        # 继续寻找结束括号
+                        continue
+        return None
     
\ No newline at end of file
@@ -1,131 +1,317 @@
-from typing import Optional
-import pdfplumber
-from pathlib import Path
-import os
-
-class PDFOfferParser:
-    """Offer PDF解析工具 - 提取文本供处理"""
-    
-    def __init__(self):
-        pass
-        
-    def extract_text(self, pdf_path: str) -> Optional[str]:
-        """
-        从Offer PDF文件中提取文本
-        
-        Args:
-            pdf_path: PDF文件路径或临时文件标识符
-            
-        Returns:
-            提取的文本内容,失败则返回None
-        """
-        try:
-            print(f"开始解析Offer PDF文件: {pdf_path}")
-            
-            # 添加临时文件查找逻辑
-            file_path = self._find_pdf_file(pdf_path)
-            if not file_path:
-                print(f"找不到PDF文件: {pdf_path}")
-                return None
-            
-            pdf_path = str(file_path)  # 确保路径是字符串类型
-            
-            with pdfplumber.open(pdf_path) as pdf:
-                text = ""
-                for page in pdf.pages:
-                    # 提取文本
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-                        
-                # 清理文本
-                text = self._clean_text(text)
-                
-                print(f"Offer PDF解析完成,提取文本长度: {len(text)}")
-                return text
-                
-        except Exception as e:
-            print(f"Offer PDF解析失败: {str(e)}")
-            return None
-    
-    def _find_pdf_file(self, file_identifier: str) -> Optional[Path]:
-        """
-        查找PDF文件的实际位置
-        
-        Args:
-            file_identifier: 文件标识符(可能是路径或临时ID)
-            
-        Returns:
-            文件路径，找不到则返回None
-        """
-        # 如果是有效路径则直接返回
-        path = Path(file_identifier)
-        if path.exists() and path.is_file():
-            return path
-        
-        # 尝试在常见位置查找文件
-        possible_locations = [
-            Path.cwd() / file_identifier,  # 当前目录
-            Path.cwd() / f"{file_identifier}.pdf",  # 添加扩展名
-            Path.cwd() / "public" / file_identifier,  # public目录
-            Path.cwd() / "public" / f"{file_identifier}.pdf",
-            Path.cwd() / "temp_files" / file_identifier,  # 临时文件目录
-            Path.cwd() / "public" / "temp" / file_identifier,  # public/temp目录
-            Path.cwd() / "tmp" / file_identifier,  # tmp目录
-            Path("/tmp") / file_identifier  # Linux/MacOS临时目录
-        ]
-        
-        # 如果是临时文件ID，尝试更多组合
-        if file_identifier.startswith("temp_"):
-            temp_dirs = [
-                Path.cwd() / "temp_files",
-                Path.cwd() / "public" / "temp",
-                Path.cwd() / "tmp",
-                Path("/tmp")
-            ]
-            
-            for temp_dir in temp_dirs:
-                if temp_dir.exists():
-                    # 查找所有以该ID开头的文件
-                    for file_path in temp_dir.glob(f"{file_identifier}*"):
-                        if file_path.is_file():
-                            print(f"找到匹配的临时文件: {file_path}")
-                            return file_path
-        
-        # 检查所有可能的位置
-        for location in possible_locations:
-            if location.exists() and location.is_file():
-                print(f"找到文件: {location}")
-                return location
-        
-        # 都找不到
-        return None
-            
-    def _clean_text(self, text: str) -> str:
-        """
-        清理提取的文本
-        
-        Args:
-            text: 原始文本
-            
-        Returns:
-            清理后的文本
-        """
-        if not text:
-            return ""
-            
-        # 1. 删除多余的空白字符
-        text = " ".join(text.split())
-        
-        # 2. 替换特殊字符
-        text = text.replace("\x00", "")
-        
-        # 3. 确保段落之间有空行
-        text = text.replace("。", "。\n")
-        text = text.replace(".", ".\n")
-        
-        # 4. 删除重复的换行
-        while "\n\n\n" in text:
-            text = text.replace("\n\n\n", "\n\n")
-            
+from typing import Dict, List, Optional, Union
+import functools
+import io
+import logging
+import pdfplumber
+from pathlib import Path
+import os
+import re
+
+try:
+    import pymupdf
+except ImportError:
+    # 旧版本PyMuPDF只提供fitz模块名
+    import fitz as pymupdf
+
+# pypdfium2为可选依赖，PyMuPDF提取不到文本时在pdfplumber之前尝试
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+logger = logging.getLogger(__name__)
+
+# 清理文本时使用的正则表达式（模块加载时编译一次，每个只需扫描文本一遍）
+_SENTENCE_END_RE = re.compile(r"([。.])")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+# 需要删除的特殊字符，使用str.translate一次处理
+_REMOVE_CHARS_TABLE = str.maketrans("", "", "\x00")
+
+@functools.lru_cache(maxsize=1)
+def _list_temp_candidates(cwd: str) -> Dict[str, Path]:
+    """
+    列出各临时目录中以temp_开头的文件（结果缓存，批量处理时只扫描一次目录）
+    
+    Args:
+        cwd: 当前工作目录，临时目录相对于它查找
+        
+    Returns:
+        文件名到文件路径的映射，按临时目录的查找顺序排列
+    """
+    temp_dirs = [
+        Path(cwd) / "temp_files",
+        Path(cwd) / "public" / "temp",
+        Path(cwd) / "tmp",
+        Path("/tmp")
+    ]
+    
+    candidates = {}
+    for temp_dir in temp_dirs:
+        try:
+            with os.scandir(temp_dir) as entries:
+                for entry in entries:
+                    if entry.name.startswith("temp_") and entry.is_file():
+                        candidates.setdefault(entry.name, Path(entry.path))
+        except OSError:
+            # 目录不存在或无法读取
+            continue
+    return candidates
+
+class PDFOfferParser:
+    """Offer PDF解析工具 - 提取文本供处理"""
+    
+    def __init__(self):
+        pass
+        
+    def extract_text(self, pdf_path: str, already_validated: bool = False) -> Optional[str]:
+        """
+        从Offer PDF文件中提取文本
+        
+        Args:
+            pdf_path: PDF文件路径或临时文件标识符
+            already_validated: 调用方已确认pdf_path是存在的文件时为True，跳过文件查找
+            
+        Returns:
+            提取的文本内容,失败则返回None
+        """
+        try:
+            logger.debug("开始解析Offer PDF文件: %s", pdf_path)
+            
+            # 添加临时文件查找逻辑
+            if not already_validated:
+                file_path = self._find_pdf_file(pdf_path)
+                if not file_path:
+                    logger.warning("找不到PDF文件: %s", pdf_path)
+                    return None
+                pdf_path = file_path
+            
+            pdf_path = str(pdf_path)  # 确保路径是字符串类型
+            
+            return self._extract_from_source(pdf_path)
+                
+        except Exception as e:
+            logger.error("Offer PDF解析失败: %s", e)
+            return None
+    
+    def extract_text_from_bytes(self, data: bytes) -> Optional[str]:
+        """
+        从内存中的Offer PDF数据提取文本（无需先写入文件）
+        
+        Args:
+            data: PDF文件内容
+            
+        Returns:
+            提取的文本内容,失败则返回None
+        """
+        try:
+            logger.debug("开始解析Offer PDF数据: %d字节", len(data))
+            return self._extract_from_source(data)
+            
+        except Exception as e:
+            logger.error("Offer PDF解析失败: %s", e)
+            return None
+    
+    def _extract_from_source(self, source: Union[str, bytes]) -> str:
+        """
+        依次使用各个后端提取文本并清理
+        
+        Args:
+            source: PDF文件路径或PDF文件内容
+            
+        Returns:
+            清理后的文本
+        """
+        # 优先使用PyMuPDF提取文本，不经过pdfminer的版面分析，速度快很多
+        text = self._extract_with_pymupdf(source)
+        
+        # PyMuPDF没有提取到文本时，依次尝试pypdfium2和pdfplumber
+        if not text.strip() and pdfium is not None:
+            text = self._extract_with_pdfium(source)
+        if not text.strip():
+            text = self._extract_with_pdfplumber(source)
+            
+        # 清理文本
+        text = self._clean_text(text)
+        
+        logger.debug("Offer PDF解析完成,提取文本长度: %d", len(text))
+        return text
+    
+    def _extract_with_pymupdf(self, source: Union[str, bytes]) -> str:
+        """
+        使用PyMuPDF逐页提取文本
+        
+        Args:
+            source: PDF文件路径或PDF文件内容
+            
+        Returns:
+            各页文本以换行连接后的结果
+        """
+        if isinstance(source, bytes):
+            doc = pymupdf.open(stream=source, filetype="pdf")
+        else:
+            doc = pymupdf.open(source)
+        with doc:
+            return "\n".join(page.get_text("text") for page in doc)
+    
+    def _extract_with_pdfium(self, source: Union[str, bytes]) -> str:
+        """
+        使用pypdfium2逐页提取纯文本（不做版面分析）
+        
+        Args:
+            source: PDF文件路径或PDF文件内容
+            
+        Returns:
+            各页文本以换行连接后的结果
+        """
+        parts = []
+        pdf = pdfium.PdfDocument(source)  # 同时支持文件路径和bytes
+        try:
+            page_count = len(pdf)
+            for index in range(page_count):
+                page = pdf[index]
+                textpage = page.get_textpage()
+                parts.append(textpage.get_text_range())
+                textpage.close()
+                page.close()
+        finally:
+            pdf.close()
+        return "\n".join(parts)
+    
+    def _extract_with_pdfplumber(self, source: Union[str, bytes]) -> str:
+        """
+        使用pdfplumber逐页提取文本（PyMuPDF提取失败时的备用方案）
+        
+        Args:
+            source: PDF文件路径或PDF文件内容
+            
+        Returns:
+            各页文本以换行连接后的结果
+        """
+        with pdfplumber.open(io.BytesIO(source) if isinstance(source, bytes) else source) as pdf:
+            # 备用方案只在PyMuPDF提取不到文本时运行（多为扫描件），逐页在当前进程解析，不承担进程池的启动开销
+            parts = [page.extract_text() or "" for page in pdf.pages]
+            
+        # 每页之间添加换行，最后统一拼接
+        return "\n".join(p for p in parts if p)
+    
+    def _find_pdf_file(self, file_identifier: str) -> Optional[Path]:
+        """
+        查找PDF文件的实际位置
+        
+        Args:
+            file_identifier: 文件标识符(可能是路径或临时ID)
+            
+        Returns:
+            文件路径，找不到则返回None
+        """
+        # 如果是有效路径则直接返回（只需一次stat）
+        if os.path.isfile(file_identifier):
+            return Path(file_identifier)
+        
+        # 绝对路径拼接到其他目录后仍是它自身，只需再尝试添加扩展名
+        if os.path.isabs(file_identifier):
+            pdf_path = f"{file_identifier}.pdf"
+            return Path(pdf_path) if os.path.isfile(pdf_path) else None
+        
+        # 尝试在常见位置查找文件
+        possible_locations = [
+            Path.cwd() / file_identifier,  # 当前目录
+            Path.cwd() / f"{file_identifier}.pdf",  # 添加扩展名
+            Path.cwd() / "public" / file_identifier,  # public目录
+            Path.cwd() / "public" / f"{file_identifier}.pdf",
+            Path.cwd() / "temp_files" / file_identifier,  # 临时文件目录
+            Path.cwd() / "public" / "temp" / file_identifier,  # public/temp目录
+            Path.cwd() / "tmp" / file_identifier,  # tmp目录
+            Path("/tmp") / file_identifier  # Linux/MacOS临时目录
+        ]
+        
+        # 如果是临时文件ID，在缓存的临时目录文件列表中查找
+        if file_identifier.startswith("temp_"):
+            file_path = self._find_temp_file(file_identifier)
+            if file_path:
+                logger.debug("找到匹配的临时文件: %s", file_path)
+                return file_path
+        
+        # 检查所有可能的位置
+        for location in possible_locations:
+            if location.exists() and location.is_file():
+                logger.debug("找到文件: %s", location)
+                return location
+        
+        # 都找不到
+        return None
+            
+    def _find_temp_file(self, file_identifier: str) -> Optional[Path]:
+        """
+        在临时目录中查找以该ID开头的文件
+        
+        缓存中找不到时重新扫描一次目录，以便找到缓存之后新上传的文件
+        
+        Args:
+            file_identifier: 临时文件ID
+            
+        Returns:
+            文件路径，找不到则返回None
+        """
+        for refresh in (False, True):
+            if refresh:
+                self.clear_file_cache()
+            candidates = _list_temp_candidates(os.getcwd())
+            
+            # 先按完整文件名查找，再查找所有以该ID开头的文件
+            file_path = candidates.get(file_identifier)
+            if file_path is None:
+                file_path = next(
+                    (path for name, path in candidates.items() if name.startswith(file_identifier)),
+                    None
+                )
+            if file_path is not None and file_path.is_file():
+                return file_path
+        return None
+    
+    def resolve_files(self, file_identifiers: List[str]) -> List[Optional[Path]]:
+        """
+        批量查找多个PDF文件的实际位置（批量处理开始时调用，临时目录只扫描一次）
+        
+        Args:
+            file_identifiers: 文件标识符列表(可能是路径或临时ID)
+            
+        Returns:
+            与输入顺序对应的文件路径列表，找不到的文件为None
+        """
+        # 新一批文件可能刚写入临时目录，先清空临时文件列表缓存
+        self.clear_file_cache()
+        return [self._find_pdf_file(file_identifier) for file_identifier in file_identifiers]
+    
+    @staticmethod
+    def clear_file_cache() -> None:
+        """清空临时目录文件列表缓存（开始批量处理前调用）"""
+        _list_temp_candidates.cache_clear()
+            
+    def _clean_text(self, text: str) -> str:
+        """
+        清理提取的文本
+        
+        Args:
+            text: 原始文本
+            
+        Returns:
+            清理后的文本
+        """
+        if not text:
+            return ""
+            
+        # 1. 删除多余的空白字符
+        text = " ".join(text.split())
+        
+        # 2. 替换特殊字符
+        text = text.translate(_REMOVE_CHARS_TABLE)
+        
+        # 3. 确保段落之间有空行（中英文句号一次处理）
+        text = _SENTENCE_END_RE.sub(r"\1\n", text)
+        
+        # 4. 删除重复的换行
+        text = _BLANK_LINES_RE.sub("\n\n", text)
+            
         return text.strip() 
\ No newline at end of file
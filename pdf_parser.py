@@ -1,100 +1,252 @@
-from typing import Optional
-import pdfplumber
-from pathlib import Path
-
-class PDFParser:
-    """PDF解析工具 - 提取文本供处理"""
-    
-    def __init__(self):
-        pass
-        
-    def extract_text(self, pdf_path: str) -> Optional[str]:
-        """
-        从PDF文件中提取文本
-        
-        Args:
-            pdf_path: PDF文件路径
-            
-        Returns:
-            提取的文本内容，如果失败则返回None
-        """
-        try:
-            print(f"开始处理PDF文件: {pdf_path}")
-            
-            if not Path(pdf_path).exists():
-                print(f"PDF文件不存在: {pdf_path}")
-                return None
-                
-            with pdfplumber.open(pdf_path) as pdf:
-                text = ""
-                for page in pdf.pages:
-                    # 调整提取参数
-                    page_text = page.extract_text(
-                        x_tolerance=1,  # 增加水平容差
-                        y_tolerance=1,  # 增加垂直容差
-                        layout=True,    # 保持布局
-                        keep_blank_chars=True,  # 保留空格
-                        use_text_flow=True,     # 使用文本流
-                    ) or ""
-                    text += page_text + "\n"  # 每页之间添加换行
-                    
-            if not text.strip():
-                print(f"PDF文件内容为空: {pdf_path}")
-                return None
-                
-            # 调用清理文本的方法
-            text = self._clean_text(text)
-                
-            print(f"成功提取PDF文本，长度: {len(text)}")
-            return text
-            
-        except Exception as e:
-            print(f"处理PDF文件时出错: {str(e)}")
-            return None
-            
-    def _clean_text(self, text: str) -> str:
-        """
-        清理提取的文本，保持简单
-        """
-        if not text:
-            return ""
-            
-        # 1. 分割成行处理
-        lines = text.split("\n")
-        cleaned_lines = []
-        
-        for line in lines:
-            # 跳过空行
-            if not line.strip():
-                cleaned_lines.append("")
-                continue
-                
-            # 处理每行文本，确保词之间有空格
-            words = [w for w in line.split() if w]
-            if words:
-                cleaned_lines.append(" ".join(words))
-        
-        # 2. 重新组合文本
-        text = "\n".join(cleaned_lines)
-        
-        # 3. 确保段落标题前后有空行
-        section_headers = [
-            "EDUCATION",
-            "EXPERIENCE",
-            "INTERNSHIP",
-            "PROJECT",
-            "PUBLICATION",
-            "SKILLS",
-            "AWARDS",
-            "ACTIVITIES",
-            "EXTRACURRICULAR"
-        ]
-        
-        for header in section_headers:
-            text = text.replace(header, f"\n\n{header}\n")
-            
-        # 4. 规范化空行
-        while "\n\n\n" in text:
-            text = text.replace("\n\n\n", "\n\n")
-            
+from typing import Optional, Union
+import io
+import logging
+import re
+import pdfplumber
+from pathlib import Path
+
+try:
+    import pymupdf
+except ImportError:
+    # 旧版本PyMuPDF只提供fitz模块名
+    import fitz as pymupdf
+
+# pyahocorasick为可选依赖，用于一次扫描标记所有段落标题，未安装时使用正则表达式
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# pypdfium2为可选依赖，PyMuPDF提取不到文本时在pdfplumber之前尝试
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+logger = logging.getLogger(__name__)
+
+# 简历中常见的段落标题
+SECTION_HEADERS = [
+    "EDUCATION",
+    "EXPERIENCE",
+    "INTERNSHIP",
+    "PROJECT",
+    "PUBLICATION",
+    "SKILLS",
+    "AWARDS",
+    "ACTIVITIES",
+    "EXTRACURRICULAR"
+]
+
+# 清理文本时使用的正则表达式（模块加载时编译一次，每个只需扫描文本一遍）
+_SECTION_RE = re.compile("(" + "|".join(SECTION_HEADERS) + ")")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+_INLINE_SPACE_RE = re.compile(r"[^\S\n]+")
+_LINE_EDGE_SPACE_RE = re.compile(r" *\n *")
+
+
+def _build_section_automaton():
+    """构建段落标题的Aho-Corasick自动机，未安装pyahocorasick时返回None"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for header in SECTION_HEADERS:
+        automaton.add_word(header, header)
+    automaton.make_automaton()
+    return automaton
+
+_SECTION_AUTOMATON = _build_section_automaton()
+
+
+def _mark_section_headers(text: str) -> str:
+    """
+    在段落标题前后添加空行，与_SECTION_RE.sub(r"\n\n\1\n", text)的结果一致
+    
+    Args:
+        text: 待处理的文本
+        
+    Returns:
+        处理后的文本
+    """
+    if _SECTION_AUTOMATON is None:
+        return _SECTION_RE.sub(r"\n\n\1\n", text)
+        
+    parts = []
+    last_end = 0
+    # 匹配结果按结束位置排列；标题之间互不包含，因此也按起始位置排列
+    for end, header in _SECTION_AUTOMATON.iter(text):
+        start = end - len(header) + 1
+        if start < last_end:
+            # 与上一个标题重叠，正则表达式同样会跳过
+            continue
+        parts.append(text[last_end:start])
+        parts.append(f"\n\n{header}\n")
+        last_end = end + 1
+    parts.append(text[last_end:])
+    return "".join(parts)
+
+class PDFParser:
+    """PDF解析工具 - 提取文本供处理"""
+    
+    def __init__(self):
+        pass
+        
+    def extract_text(self, pdf_path: str, max_pages: Optional[int] = None) -> Optional[str]:
+        """
+        从PDF文件中提取文本
+        
+        Args:
+            pdf_path: PDF文件路径
+            max_pages: 最多提取的页数，None表示提取全部页面
+            
+        Returns:
+            提取的文本内容，如果失败则返回None
+        """
+        try:
+            logger.debug("开始处理PDF文件: %s", pdf_path)
+            
+            if not Path(pdf_path).exists():
+                logger.warning("PDF文件不存在: %s", pdf_path)
+                return None
+                
+            return self._extract_from_source(pdf_path, max_pages, pdf_path)
+            
+        except Exception as e:
+            logger.error("处理PDF文件时出错: %s", e)
+            return None
+            
+    def extract_text_from_bytes(self, data: bytes, max_pages: Optional[int] = None) -> Optional[str]:
+        """
+        从内存中的PDF数据提取文本（无需先写入文件）
+        
+        Args:
+            data: PDF文件内容
+            max_pages: 最多提取的页数，None表示提取全部页面
+            
+        Returns:
+            提取的文本内容，如果失败则返回None
+        """
+        try:
+            logger.debug("开始处理PDF数据: %d字节", len(data))
+            return self._extract_from_source(data, max_pages, "<内存数据>")
+            
+        except Exception as e:
+            logger.error("处理PDF数据时出错: %s", e)
+            return None
+            
+    def _extract_from_source(self, source: Union[str, bytes], max_pages: Optional[int], name: str) -> Optional[str]:
+        """
+        依次使用各个后端提取文本并清理
+        
+        Args:
+            source: PDF文件路径或PDF文件内容
+            max_pages: 最多提取的页数，None表示提取全部页面
+            name: 日志中显示的名称
+            
+        Returns:
+            提取的文本内容，内容为空时返回None
+        """
+        # 优先使用PyMuPDF提取文本，不经过pdfminer的版面分析，速度快很多
+        text = self._extract_with_pymupdf(source, max_pages)
+        
+        # PyMuPDF没有提取到文本时，依次尝试pypdfium2和pdfplumber
+        if not text.strip() and pdfium is not None:
+            text = self._extract_with_pdfium(source, max_pages)
+        if not text.strip():
+            text = self._extract_with_pdfplumber(source, max_pages)
+                
+        if not text.strip():
+            logger.warning("PDF文件内容为空: %s", name)
+            return None
+            
+        # 调用清理文本的方法
+        text = self._clean_text(text)
+            
+        logger.debug("成功提取PDF文本，长度: %d", len(text))
+        return text
+            
+    def _extract_with_pymupdf(self, source: Union[str, bytes], max_pages: Optional[int] = None) -> str:
+        """
+        使用PyMuPDF逐页提取文本
+        
+        Args:
+            source: PDF文件路径或PDF文件内容
+            max_pages: 最多提取的页数，None表示提取全部页面
+            
+        Returns:
+            各页文本以换行连接后的结果
+        """
+        if isinstance(source, bytes):
+            doc = pymupdf.open(stream=source, filetype="pdf")
+        else:
+            doc = pymupdf.open(source)
+        with doc:
+            pages = doc if max_pages is None else doc.pages(0, min(max_pages, doc.page_count))
+            return "\n".join(page.get_text("text") for page in pages)
+    
+    def _extract_with_pdfium(self, source: Union[str, bytes], max_pages: Optional[int] = None) -> str:
+        """
+        使用pypdfium2逐页提取纯文本（不做版面分析）
+        
+        Args:
+            source: PDF文件路径或PDF文件内容
+            max_pages: 最多提取的页数，None表示提取全部页面
+            
+        Returns:
+            各页文本以换行连接后的结果
+        """
+        parts = []
+        pdf = pdfium.PdfDocument(source)  # 同时支持文件路径和bytes
+        try:
+            page_count = len(pdf) if max_pages is None else min(max_pages, len(pdf))
+            for index in range(page_count):
+                page = pdf[index]
+                textpage = page.get_textpage()
+                parts.append(textpage.get_text_range())
+                textpage.close()
+                page.close()
+        finally:
+            pdf.close()
+        return "\n".join(parts)
+    
+    def _extract_with_pdfplumber(self, source: Union[str, bytes], max_pages: Optional[int] = None) -> str:
+        """
+        使用pdfplumber逐页提取文本（PyMuPDF提取失败时的备用方案）
+        
+        Args:
+            source: PDF文件路径或PDF文件内容
+            max_pages: 最多提取的页数，None表示提取全部页面
+            
+        Returns:
+            各页文本以换行连接后的结果
+        """
+        # 只解析需要的页面（pdfplumber的页码从1开始）
+        pages = None if max_pages is None else list(range(1, max_pages + 1))
+        with pdfplumber.open(io.BytesIO(source) if isinstance(source, bytes) else source, pages=pages) as pdf:
+            # 备用方案只在PyMuPDF提取不到文本时运行（多为扫描件），逐页在当前进程解析，不承担进程池的启动开销
+            # 使用默认参数提取，布局在_clean_text中会被重新整理，无需layout等开销较大的选项
+            parts = [page.extract_text() or "" for page in pdf.pages]
+            
+        # 每页之间添加换行，最后统一拼接
+        return "\n".join(p for p in parts if p)
+            
+    def _clean_text(self, text: str) -> str:
+        """
+        清理提取的文本，保持简单
+        """
+        if not text:
+            return ""
+            
+        # 1. 对整段文本一次性处理：行内连续空白合并为一个空格，并去掉行首行尾的空格
+        text = _INLINE_SPACE_RE.sub(" ", text)
+        
+        # 2. 空白行变为空行
+        text = _LINE_EDGE_SPACE_RE.sub("\n", text)
+        
+        # 3. 确保段落标题前后有空行（一次扫描处理所有标题）
+        text = _mark_section_headers(text)
+            
+        # 4. 规范化空行
+        text = _BLANK_LINES_RE.sub("\n\n", text)
+            
         return text.strip() 
\ No newline at end of file
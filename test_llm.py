@@ -1,502 +1,666 @@
-import os
-import sys
-import json
-import asyncio
-from pathlib import Path
-from processor import SimpleProcessor
-from llm_processor import LLMProcessor
-from config_loader import load_api_config
-from qs_usnews_school_dict import qs_school_ranking, usnews_school_ranking
-
-def calculate_student_tags(student_data):
-    """
-    基于学生数据计算适用的标签(tags)
-    
-    此函数根据学生的学术成绩、录取学校和奖学金情况，判断学生是否符合以下标签：
-    - 奖学金：学生获得了任何形式的奖学金
-    - 低分逆袭：学生GPA或语言成绩偏低，但被排名前100的大学录取
-    - 低龄留学：学生被K12级别的学校录取
-    
-    Args:
-        student_data (dict): 包含学生信息的字典(处理后的数据)，包括:
-            - gpaValue: GPA成绩值
-            - testScores: 考试成绩列表
-            - admissions: 录取学校列表
-        
-    Returns:
-        str or None: 加号分隔的标签字符串，如果没有任何适用标签则返回None
-    """
-    # 存储识别出的所有适用标签
-    tags = []
-    
-    # 提取关键数据，用于后续标签判断
-    resume_data = student_data.get("resume_analysis", {})
-    education = resume_data.get("education", {})
-    gpa_value = education.get("gpaValue")  # 从education中获取GPA成绩
-    test_scores = resume_data.get("testScores", [])  # 从resume_analysis中获取语言和标准化考试成绩
-    
-    try:
-    # 从offer_analyses中提取admissions信息
-        admissions = []
-        for offer in student_data.get("offer_analyses", []):
-            admissions.extend(offer.get("admissions", []))
-    except Exception as e:
-        print(f"提取admissions信息时出错: {e}, {student_data}")
-        return None
-    
-    #--------------------------------------------------
-    # 1. 判断'奖学金'标签
-    #--------------------------------------------------
-    # 只要任何一所学校提供了奖学金，就添加"奖学金"标签
-    has_scholarship = False
-    for adm in admissions:
-        # 检查hasScholarship字段为true或scholarshipAmount字段非空
-        if adm.get("hasScholarship") == True or adm.get("scholarshipAmount"):
-            has_scholarship = True
-            break
-    
-    if has_scholarship:
-        tags.append("奖学金")
-    
-    #--------------------------------------------------
-    # 2. 判断'低分逆袭'标签
-    #--------------------------------------------------
-    # 低分逆袭需要同时满足两个条件：1) 成绩较低 2) 录取学校排名好
-    low_score = False  # 标记成绩是否较低
-    good_ranking = False  # 标记是否有排名好的学校录取
-    
-    # 2.1 检查GPA是否低于3.2
-    if gpa_value and isinstance(gpa_value, (int, float, str)):
-        try:
-            # 尝试将GPA转换为浮点数进行比较
-            gpa = float(gpa_value)
-            if gpa < 3.2:  # GPA低于3.2被视为"低分"
-                low_score = True
-        except (ValueError, TypeError):
-            pass  # 忽略无法转换为数字的GPA
-    
-    # 2.2 检查语言成绩是否低
-    for test in test_scores:
-        test_name = test.get("testName", "").lower()  # 获取考试名称并转小写
-        test_score = test.get("testScore")  # 获取考试分数
-        
-        if test_score and isinstance(test_score, (int, float, str)):
-            try:
-                # 处理可能的格式: "总分: 88"或直接数字
-                score_str = str(test_score)
-                # 如果包含冒号，提取冒号后的数字部分
-                score_val = float(score_str.split(":")[-1].strip() if ":" in score_str else score_str)
-                
-                # 检查托福分数是否低于90
-                if ("托福" in test_name or "toefl" in test_name) and score_val < 90:
-                    low_score = True
-                # 检查雅思分数是否低于6.5
-                elif ("雅思" in test_name or "ielts" in test_name) and score_val < 6.5:
-                    low_score = True
-            except (ValueError, TypeError):
-                pass  # 忽略无法解析的分数
-    
-    # 2.3 检查是否有排名前100的学校录取
-    for adm in admissions:
-        ranking = adm.get("rankingValue")  # 获取学校排名
-        if ranking and isinstance(ranking, (int, float, str)):
-            try:
-                # 尝试将排名转换为浮点数
-                rank_val = float(ranking)
-                if rank_val < 100:  # 排名小于100被视为"好学校"
-                    good_ranking = True
-                    break
-            except (ValueError, TypeError):
-                pass  # 忽略无法转换为数字的排名
-    
-    # 如果同时满足"成绩较低"和"学校排名好"两个条件，添加"低分逆袭"标签
-    if low_score and good_ranking:
-        tags.append("低分逆袭")
-    
-    #--------------------------------------------------
-    # 3. 判断'低龄留学'标签
-    #--------------------------------------------------
-    # K12相关的关键词列表，用于识别K12学校
-    k12_keywords = ["K12", "k12", "High School", "high school", "Middle School", 
-                   "middle school", "小学", "中学", "高中", "Elementary", "Secondary",
-                   "Preparatory", "Prep", "Academy", "Day School", "Grammar School", 
-                   "Primary", "Junior"]
-    
-    # "The X School"模式的正则表达式
-    the_x_school_pattern = r"^the\s+[\w\s\-']+\s+school$"
-    
-    has_k12_school = False
-    
-    # 遍历所有录取学校
-    for adm in admissions:
-        # 首先检查是否为OTHER类型 - 这是K12学校的必要条件
-        if adm.get("degreeType") == "OTHER":
-            # 获取学校名称和项目名称
-            school = str(adm.get("school", "")).lower()
-            program = str(adm.get("program", "")).lower()
-            
-            # 方法1: 检查学校名称或项目名称中是否包含K12相关关键词
-            for keyword in k12_keywords:
-                if keyword.lower() in school or keyword.lower() in program:
-                    has_k12_school = True
-                    break
-            
-            # 如果关键词检查没有找到匹配，尝试其他模式匹配
-            if not has_k12_school:
-                # 方法2: 检查是否符合"The X School"模式且不含"University"或"College"
-                if (school.startswith("the ") and school.endswith(" school") and 
-                    "university" not in school and "college" not in school):
-                    has_k12_school = True
-                
-                # 方法3: 检查degreeType为OTHER，同时也缺少排名信息和专业具体信息可能是K12
-                elif (adm.get("degreeType") == "OTHER" and 
-                     (not adm.get("rankingValue") or not adm.get("rankingType")) and
-                     (program == "专业未定" or program == "无专业" or "general" in program.lower())):
-                    has_k12_school = True
-            
-            # 如果已确定是K12学校，添加标签并跳出循环
-            if has_k12_school:
-                tags.append("低龄留学")
-                break
-    
-    # 返回结果：如果有标签则返回加号分隔的标签字符串，否则返回None
-    return "+".join(tags) if tags else None
-
-def enrich_school_rankings(analysis_data):
-    """
-    基于学校名称和排名类型，自动填充rankingValue和rankingTier字段
-    
-    Args:
-        analysis_data (dict): 包含学生信息的字典(LLM处理后的数据)
-    
-    Returns:
-        dict: 更新后的分析数据，包含填充后的排名信息
-    """
-    # 检查输入是否有效
-    if not analysis_data or not isinstance(analysis_data, dict):
-        return analysis_data
-    
-    # 从offer_analyses中提取admissions信息
-    offer_analyses = analysis_data.get("offer_analyses", [])
-    
-    # 遍历所有offer和admission记录
-    for offer in offer_analyses:
-        admissions = offer.get("admissions", [])
-        for admission in admissions:
-            # 只处理rankingValue为空的记录
-            if not admission.get("rankingValue"):
-                school_name = admission.get("school", "")
-                ranking_type = admission.get("rankingType", "")
-                
-                # 根据rankingType选择对应的排名字典
-                if ranking_type == "QS":
-                    ranking_dict = qs_school_ranking
-                elif ranking_type == "US News":
-                    ranking_dict = usnews_school_ranking
-                else:
-                    # 如果没有明确的排名类型，跳过处理
-                    continue
-                
-                # 在排名字典中查找学校
-                ranking = None
-                for rank, name in ranking_dict.items():
-                    # 使用部分匹配，因为学校名称可能不完全一致
-                    if school_name.lower() in name.lower() or name.lower() in school_name.lower():
-                        ranking = rank
-                        break
-                
-                # 如果找到排名，则更新rankingValue和rankingTier
-                if ranking:
-                    admission["rankingValue"] = str(ranking)
-                    
-                    # 设置rankingTier
-                    if ranking <= 5:
-                        admission["rankingTier"] = "TOP5"
-                    elif ranking <= 10:
-                        admission["rankingTier"] = "TOP10"
-                    elif ranking <= 30:
-                        admission["rankingTier"] = "TOP30"
-                    elif ranking <= 50:
-                        admission["rankingTier"] = "TOP50"
-                    elif ranking <= 100:
-                        admission["rankingTier"] = "TOP100"
-    
-    return analysis_data
-
-def main():
-    """测试LLM处理器与简化版处理器的集成"""
-    print("=== 测试LLM处理器与简化版处理器的集成 ===")
-    
-    # 加载配置
-    config = load_api_config()
-    
-    # 检查API配置
-    if not config or "OPENAI_API_KEY" not in config:
-        print("警告: 配置文件中未找到OPENAI_API_KEY")
-        print("尝试从环境变量获取...")
-        
-        # 尝试从环境变量获取
-        api_key = os.environ.get("OPENAI_API_KEY")
-        if not api_key:
-            print("错误: 未能获取API密钥，请确保api_config.json包含OPENAI_API_KEY或设置环境变量")
-            return
-    
-    # 创建处理器实例
-    processor = SimpleProcessor()
-    
-    # 创建LLM处理器实例
-    try:
-        llm_processor = LLMProcessor()
-        print("LLM处理器初始化成功")
-    except ValueError as e:
-        print(f"LLM处理器初始化失败: {e}")
-        return
-    
-    # 获取当前目录及其父目录
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    parent_dir = os.path.dirname(current_dir)
-    
-    # 查找工作目录中的PDF文件
-    pdf_files = []
-    for root, dirs, files in os.walk(os.path.join(parent_dir, 'simple_processor')):
-        for file in files:
-            if file.lower().endswith('.pdf'):
-                pdf_files.append(os.path.join(root, file))
-    
-    if not pdf_files:
-        print("未找到PDF文件，请确保文件夹中包含PDF文件")
-        return
-    
-    # 显示找到的文件
-    print(f"\n找到 {len(pdf_files)} 个PDF文件:")
-    for i, file in enumerate(pdf_files):
-        print(f"{i+1}. {file}")
-    
-    # 如果找到多个文件，让用户选择
-    selected_resume = None
-    selected_offer = None
-    
-    if len(pdf_files) == 1:
-        # 只有一个文件，将其作为简历处理
-        print("\n只找到一个PDF文件，将其作为简历处理")
-        selected_resume = pdf_files[0]
-    else:
-        # 有多个文件，让用户选择
-        print("\n请选择简历文件(输入编号):")
-        try:
-            resume_index = int(input("> ")) - 1
-            if 0 <= resume_index < len(pdf_files):
-                selected_resume = pdf_files[resume_index]
-                
-                print("\n请选择Offer文件(输入编号，或输入0跳过):")
-                offer_index = int(input("> ")) - 1
-                if 0 <= offer_index < len(pdf_files) and offer_index != resume_index:
-                    selected_offer = pdf_files[offer_index]
-            else:
-                print("输入的编号无效，将只处理简历文件")
-                selected_resume = pdf_files[0] if pdf_files else None
-        except ValueError:
-            print("输入无效，将只处理第一个PDF文件作为简历")
-            selected_resume = pdf_files[0] if pdf_files else None
-    
-    # 处理简历
-    if selected_resume:
-        print(f"\n=== 处理简历文件: {selected_resume} ===")
-        resume_result = processor.process_resume(selected_resume)
-        
-        if resume_result["success"]:
-            print("简历文本提取成功")
-            print(f"提取文本长度: {len(resume_result['content'])}")
-            print("\n文本预览(前200字符):")
-            print(resume_result["content"][:200] + "...")
-            
-            # 使用LLM处理简历文本
-            print("\n=== 使用LLM分析简历 ===")
-            resume_analysis = llm_processor.analyze_resume(resume_result["content"])
-            
-            # 检查是否有错误
-            if "error" in resume_analysis:
-                print(f"LLM分析失败: {resume_analysis.get('error')}")
-                if "details" in resume_analysis:
-                    print(f"详细信息: {resume_analysis.get('details')}")
-            else:
-                print("LLM分析成功，结果如下:")
-                # 使用ensure_ascii=False确保中文字符正确显示
-                result_str = json.dumps(resume_analysis, ensure_ascii=False, indent=2)
-                print(result_str)
-                
-                # 保存分析结果
-                output_file = os.path.join(current_dir, "resume_analysis.json")
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    f.write(result_str)
-                print(f"\n分析结果已保存到: {output_file}")
-        else:
-            print(f"简历处理失败: {resume_result['error']}")
-    
-    # 处理Offer
-    if selected_offer:
-        print(f"\n=== 处理Offer文件: {selected_offer} ===")
-        offer_result = processor.process_resume(selected_offer)  # 使用resume方法提取文本
-        
-        if offer_result["success"]:
-            print("Offer文本提取成功")
-            print(f"提取文本长度: {len(offer_result['content'])}")
-            print("\n文本预览(前200字符):")
-            print(offer_result["content"][:200] + "...")
-            
-            # 使用LLM处理Offer文本
-            print("\n=== 使用LLM分析Offer ===")
-            offer_analysis = llm_processor.analyze_offer(offer_result["content"])
-            
-            # 检查是否有错误
-            if "error" in offer_analysis:
-                print(f"LLM分析失败: {offer_analysis.get('error')}")
-                if "details" in offer_analysis:
-                    print(f"详细信息: {offer_analysis.get('details')}")
-            else:
-                print("LLM分析成功，结果如下:")
-                # 使用ensure_ascii=False确保中文字符正确显示
-                result_str = json.dumps(offer_analysis, ensure_ascii=False, indent=2)
-                print(result_str)
-                
-                # 保存分析结果
-                output_file = os.path.join(current_dir, "offer_analysis.json")
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    f.write(result_str)
-                print(f"\n分析结果已保存到: {output_file}")
-        else:
-            print(f"Offer处理失败: {offer_result['error']}")
-
-async def test_async_processing():
-    """测试异步并行处理简历和Offer文件"""
-    # 获取当前目录
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    
-    # 创建处理器实例
-    processor = SimpleProcessor()
-    llm_processor = LLMProcessor()
-    
-    # 寻找样本文件
-    pdf_files = []
-    for file in os.listdir(current_dir):
-        if file.lower().endswith('.pdf'):
-            pdf_files.append(os.path.join(current_dir, file))
-    
-    # 显示找到的文件
-    print(f"\n找到 {len(pdf_files)} 个PDF文件:")
-    for i, file in enumerate(pdf_files):
-        print(f"{i+1}. {file}")
-    
-    # 如果找到多个文件，让用户选择
-    selected_resume = None
-    selected_offers = []
-    
-    if len(pdf_files) == 1:
-        # 只有一个文件，将其作为简历处理
-        print("\n只找到一个PDF文件，将其作为简历处理")
-        selected_resume = pdf_files[0]
-    else:
-        # 有多个文件，让用户选择
-        print("\n请选择简历文件(输入编号):")
-        try:
-            resume_index = int(input("> ")) - 1
-            if 0 <= resume_index < len(pdf_files):
-                selected_resume = pdf_files[resume_index]
-                
-                print("\n请选择一个或多个Offer文件(输入编号，用逗号分隔，如'1,3,4'，或输入0跳过):")
-                offer_input = input("> ")
-                if offer_input != "0":
-                    offer_indices = [int(idx.strip()) - 1 for idx in offer_input.split(",")]
-                    for idx in offer_indices:
-                        if 0 <= idx < len(pdf_files) and idx != resume_index:
-                            selected_offers.append(pdf_files[idx])
-            else:
-                print("输入的编号无效，将只处理简历文件")
-                selected_resume = pdf_files[0] if pdf_files else None
-        except ValueError:
-            print("输入无效，将只处理第一个PDF文件作为简历")
-            selected_resume = pdf_files[0] if pdf_files else None
-    
-    if not selected_resume:
-        print("未选择任何简历文件，退出测试")
-        return
-    
-    # 提取简历文本
-    print(f"\n=== 提取简历文本: {selected_resume} ===")
-    resume_result = processor.process_resume(selected_resume)
-    
-    if not resume_result["success"]:
-        print(f"简历处理失败: {resume_result['error']}")
-        return
-    
-    print("简历文本提取成功")
-    print(f"提取文本长度: {len(resume_result['content'])}")
-    
-    # 提取所有Offer文本
-    offer_texts = []
-    for offer_file in selected_offers:
-        print(f"\n=== 提取Offer文本: {offer_file} ===")
-        offer_result = processor.process_resume(offer_file)  # 使用resume方法提取文本
-        
-        if offer_result["success"]:
-            print(f"Offer文本提取成功，长度: {len(offer_result['content'])}")
-            offer_texts.append(offer_result["content"])
-        else:
-            print(f"Offer处理失败: {offer_result['error']}")
-    
-    # 如果没有有效的Offer文本，则只处理简历
-    if not offer_texts:
-        print("\n=== 没有有效的Offer文本，只处理简历 ===")
-        # 使用异步方法处理简历
-        resume_analysis = await llm_processor.analyze_resume_async(resume_result["content"])
-        print("\n简历分析结果:")
-        print(json.dumps(resume_analysis, ensure_ascii=False, indent=2))
-        return
-    
-    # 使用异步方法并行处理简历和所有Offer
-    print("\n=== 开始异步并行处理简历和所有Offer ===")
-    start_time = asyncio.get_event_loop().time()
-    
-    combined_result = await llm_processor.process_documents(
-        resume_text=resume_result["content"],
-        offer_texts=offer_texts
-    )
-    
-    elapsed = asyncio.get_event_loop().time() - start_time
-    print(f"\n异步处理完成! 总耗时: {elapsed:.2f}秒")
-    
-    # 打印结果
-    print("\n=== 简历分析结果 ===")
-    print(json.dumps(combined_result["resume_analysis"], ensure_ascii=False, indent=2))
-    
-    print("\n=== Offer分析结果 ===")
-    for i, offer_analysis in enumerate(combined_result["offer_analyses"]):
-        print(f"\nOffer #{i+1} 分析结果:")
-        print(json.dumps(offer_analysis, ensure_ascii=False, indent=2))
-    
-    # 增强学校排名信息
-    combined_result = enrich_school_rankings(combined_result)
-    
-    # 计算标签
-    tags = calculate_student_tags(combined_result)
-    combined_result["tags"] = tags
-    print(f"\n添加标签: {tags}")
-    
-    # 保存结果
-    output_file = os.path.join(current_dir, "combined_analysis.json")
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(combined_result, f, ensure_ascii=False, indent=2)
-    print(f"\n组合分析结果已保存到: {output_file}")
-
-if __name__ == "__main__":
-    # 根据命令行参数选择运行同步或异步版本
-    if len(sys.argv) > 1 and sys.argv[1] == "--async":
-        print("运行异步版本的测试...")
-        asyncio.run(test_async_processing())
-    else:
-        print("运行同步版本的测试...")
-        main() 
-        
-# 运行方式
-#    python test_llm.py --async  # 异步模式
-#    python test_llm.py          # 同步模式
\ No newline at end of file
+import os
+import argparse
+import asyncio
+import bisect
+import functools
+import itertools
+import re
+from pathlib import Path
+from processor import SimpleProcessor, _dump_json_bytes
+from llm_processor import LLMProcessor
+from config_loader import load_api_config
+from qs_usnews_school_dict import qs_school_ranking, usnews_school_ranking
+
+# 可选依赖：pyahocorasick用于一次扫描匹配所有K12关键词，未安装时使用正则表达式
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# K12相关的关键词（小写），用于识别K12学校
+_K12_KEYWORDS = ("k12", "high school", "middle school", "小学", "中学", "高中", "elementary", "secondary",
+                 "preparatory", "prep", "academy", "day school", "grammar school", "primary", "junior")
+
+# 未安装pyahocorasick时使用的关键词正则表达式（模块加载时编译一次）
+_K12_RE = re.compile("|".join(map(re.escape, _K12_KEYWORDS)))
+
+def _build_k12_automaton():
+    """构建K12关键词的Aho-Corasick自动机，未安装pyahocorasick时返回None"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in _K12_KEYWORDS:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+_K12_AUTOMATON = _build_k12_automaton()
+
+def _contains_k12_keyword(school, program):
+    """学校名称或项目名称（均为小写）中是否包含K12相关关键词"""
+    if _K12_AUTOMATON is None:
+        return _K12_RE.search(school) is not None or _K12_RE.search(program) is not None
+    # 用关键词中不会出现的字符连接两个名称，一次扫描即可检查两者
+    return next(_K12_AUTOMATON.iter(f"{school}\x00{program}"), None) is not None
+
+def _has_scholarship(adm):
+    """录取记录是否提供了奖学金（hasScholarship字段为true或scholarshipAmount字段非空）"""
+    return adm.get("hasScholarship") == True or bool(adm.get("scholarshipAmount"))
+
+def _to_float(value, labeled=False):
+    """
+    将GPA、考试分数、排名等字段转换为浮点数
+    
+    Args:
+        value: 字段值
+        labeled (bool): 是否允许"总分: 88"这样带标签的字符串（取冒号后的部分）
+    
+    Returns:
+        float or None: 转换后的数值，空值或无法转换时返回None
+    """
+    if not value:
+        return None
+    # 已经是数字时直接转换，不做字符串处理（布尔值不视为数字）
+    if type(value) in (int, float):
+        try:
+            return float(value)
+        except OverflowError:
+            return None
+    if not isinstance(value, str):
+        return None
+    # 如果包含冒号，提取冒号后的数字部分
+    if labeled and ":" in value:
+        value = value.split(":")[-1]
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+def _has_good_ranking(adm):
+    """录取学校排名是否在前100"""
+    rank_val = _to_float(adm.get("rankingValue"))  # 获取学校排名，忽略无法转换为数字的排名
+    return rank_val is not None and rank_val < 100  # 排名小于100被视为"好学校"
+
+def _is_k12_admission(adm):
+    """录取学校是否为K12学校"""
+    # 首先检查是否为OTHER类型 - 这是K12学校的必要条件
+    if adm.get("degreeType") != "OTHER":
+        return False
+    
+    # 获取学校名称和项目名称
+    school = str(adm.get("school", "")).lower()
+    program = str(adm.get("program", "")).lower()
+    
+    # 方法1: 检查学校名称或项目名称中是否包含K12相关关键词
+    if _contains_k12_keyword(school, program):
+        return True
+    
+    # 方法2: 检查是否符合"The X School"模式且不含"University"或"College"
+    if (school.startswith("the ") and school.endswith(" school") and 
+        "university" not in school and "college" not in school):
+        return True
+    
+    # 方法3: 缺少排名信息和专业具体信息的OTHER类型可能是K12
+    return ((not adm.get("rankingValue") or not adm.get("rankingType")) and
+            (program == "专业未定" or program == "无专业" or "general" in program))
+
+def _is_low_score(resume_data):
+    """简历中的GPA或语言成绩是否偏低"""
+    education = resume_data.get("education", {})
+    gpa_value = education.get("gpaValue")  # 从education中获取GPA成绩
+    test_scores = resume_data.get("testScores", [])  # 从resume_analysis中获取语言和标准化考试成绩
+    
+    # 检查GPA是否低于3.2（GPA低于3.2被视为"低分"，忽略无法转换为数字的GPA）
+    gpa = _to_float(gpa_value)
+    if gpa is not None and gpa < 3.2:
+        return True
+    
+    # 检查语言成绩是否低
+    for test in test_scores:
+        test_name = test.get("testName", "").lower()  # 获取考试名称并转小写
+        # 获取考试分数，处理可能的格式: "总分: 88"或直接数字，忽略无法解析的分数
+        score_val = _to_float(test.get("testScore"), labeled=True)
+        if score_val is None:
+            continue
+        
+        # 检查托福分数是否低于90
+        if ("托福" in test_name or "toefl" in test_name) and score_val < 90:
+            return True
+        # 检查雅思分数是否低于6.5
+        elif ("雅思" in test_name or "ielts" in test_name) and score_val < 6.5:
+            return True
+    return False
+
+def _join_tags(has_scholarship, low_score, good_ranking, has_k12_school):
+    """按固定顺序组合标签，如果没有任何适用标签则返回None"""
+    tags = []
+    # 只要任何一所学校提供了奖学金，就添加"奖学金"标签
+    if has_scholarship:
+        tags.append("奖学金")
+    # 低分逆袭需要同时满足两个条件：1) 成绩较低 2) 录取学校排名好
+    if low_score and good_ranking:
+        tags.append("低分逆袭")
+    if has_k12_school:
+        tags.append("低龄留学")
+    return "+".join(tags) if tags else None
+
+def calculate_student_tags(student_data):
+    """
+    基于学生数据计算适用的标签(tags)
+    
+    此函数根据学生的学术成绩、录取学校和奖学金情况，判断学生是否符合以下标签：
+    - 奖学金：学生获得了任何形式的奖学金
+    - 低分逆袭：学生GPA或语言成绩偏低，但被排名前100的大学录取
+    - 低龄留学：学生被K12级别的学校录取
+    
+    Args:
+        student_data (dict): 包含学生信息的字典(处理后的数据)，包括:
+            - gpaValue: GPA成绩值
+            - testScores: 考试成绩列表
+            - admissions: 录取学校列表
+        
+    Returns:
+        str or None: 加号分隔的标签字符串，如果没有任何适用标签则返回None
+    """
+    resume_data = student_data.get("resume_analysis", {})
+    
+    try:
+        # 从offer_analyses中提取admissions信息
+        admissions = list(itertools.chain.from_iterable(
+            offer.get("admissions", ()) for offer in student_data.get("offer_analyses", ())
+        ))
+    except Exception as e:
+        print(f"提取admissions信息时出错: {e}, {student_data}")
+        return None
+    
+    # 一次遍历录取记录，同时判断三项条件，全部满足后提前结束
+    has_scholarship = good_ranking = has_k12_school = False
+    for adm in admissions:
+        has_scholarship = has_scholarship or _has_scholarship(adm)
+        good_ranking = good_ranking or _has_good_ranking(adm)
+        has_k12_school = has_k12_school or _is_k12_admission(adm)
+        if has_scholarship and good_ranking and has_k12_school:
+            break
+    
+    return _join_tags(has_scholarship, _is_low_score(resume_data), good_ranking, has_k12_school)
+
+# 学校名称规范化时去掉的括号内容（如"(MIT)"）和标点符号
+_PARENTHESES_RE = re.compile(r"\([^)]*\)")
+_NON_WORD_RE = re.compile(r"[^\w]+")
+
+@functools.lru_cache(maxsize=1024)
+def _normalize_school_name(name):
+    """将学校名称规范化为小写、去除标点并合并空白的形式，用于精确查找排名"""
+    return " ".join(_NON_WORD_RE.sub(" ", name.lower()).split())
+
+def _build_ranking_index(ranking_dict):
+    """
+    构建规范化学校名称到排名的索引（模块加载时构建一次）
+    
+    Args:
+        ranking_dict (dict): 排名到学校名称的字典
+    
+    Returns:
+        tuple: (规范化名称到排名的字典, 用于部分匹配的(排名, 小写名称)列表)
+    """
+    by_name = {}
+    for rank, name in ranking_dict.items():
+        # 同时登记完整名称和去掉括号缩写后的名称，相同名称保留最先出现的排名
+        by_name.setdefault(_normalize_school_name(name), rank)
+        by_name.setdefault(_normalize_school_name(_PARENTHESES_RE.sub(" ", name)), rank)
+    lowered = [(rank, name.lower()) for rank, name in ranking_dict.items()]
+    return by_name, lowered
+
+QS_BY_NAME, _QS_LOWERED = _build_ranking_index(qs_school_ranking)
+USNEWS_BY_NAME, _USNEWS_LOWERED = _build_ranking_index(usnews_school_ranking)
+
+def _find_school_ranking(school_name, by_name, lowered):
+    """
+    查找学校排名：先按规范化名称精确查找，找不到时再使用部分匹配
+    
+    Args:
+        school_name (str): 学校名称
+        by_name (dict): 规范化名称到排名的字典
+        lowered (list): (排名, 小写名称)列表
+    
+    Returns:
+        int: 排名，找不到时返回None
+    """
+    ranking = by_name.get(_normalize_school_name(school_name))
+    if ranking is not None:
+        return ranking
+        
+    # 使用部分匹配，因为学校名称可能不完全一致
+    school_lower = school_name.lower()
+    for rank, name in lowered:
+        if school_lower in name or name in school_lower:
+            return rank
+    return None
+
+@functools.lru_cache(maxsize=4096)
+def _lookup_rank(ranking_type, school_lower):
+    """
+    按排名类型查找学校排名，结果在多次调用间缓存（排名表在运行期间不会改变）
+    
+    Args:
+        ranking_type (str): 排名类型，"QS"或"US News"
+        school_lower (str): 小写的学校名称
+    
+    Returns:
+        int: 排名，找不到时返回None
+    """
+    # 根据rankingType选择对应的排名索引
+    if ranking_type == "QS":
+        return _find_school_ranking(school_lower, QS_BY_NAME, _QS_LOWERED)
+    return _find_school_ranking(school_lower, USNEWS_BY_NAME, _USNEWS_LOWERED)
+
+# 排名档位的上限（含）及对应的档位名称
+_TIER_BOUNDS = (5, 10, 30, 50, 100)
+_TIER_NAMES = ("TOP5", "TOP10", "TOP30", "TOP50", "TOP100")
+
+def _enrich_admission(admission):
+    """为rankingValue为空的录取记录填充rankingValue和rankingTier字段"""
+    # 只处理rankingValue为空的记录
+    if admission.get("rankingValue"):
+        return
+    
+    # 如果没有明确的排名类型，跳过处理
+    ranking_type = admission.get("rankingType", "")
+    if ranking_type not in ("QS", "US News"):
+        return
+    
+    # 在排名索引中查找学校
+    ranking = _lookup_rank(ranking_type, admission.get("school", "").lower())
+    
+    # 如果找到排名，则更新rankingValue和rankingTier
+    if ranking:
+        admission["rankingValue"] = str(ranking)
+        
+        # 设置rankingTier（第一个不小于排名的档位上限对应的档位）
+        tier_index = bisect.bisect_left(_TIER_BOUNDS, ranking)
+        if tier_index < len(_TIER_NAMES):
+            admission["rankingTier"] = _TIER_NAMES[tier_index]
+
+def enrich_school_rankings(analysis_data):
+    """
+    基于学校名称和排名类型，自动填充rankingValue和rankingTier字段
+    
+    Args:
+        analysis_data (dict): 包含学生信息的字典(LLM处理后的数据)
+    
+    Returns:
+        dict: 更新后的分析数据，包含填充后的排名信息
+    """
+    # 检查输入是否有效
+    if not analysis_data or not isinstance(analysis_data, dict):
+        return analysis_data
+    
+    # 从offer_analyses中提取admissions信息
+    offer_analyses = analysis_data.get("offer_analyses", [])
+    
+    # 遍历所有offer和admission记录
+    for offer in offer_analyses:
+        for admission in offer.get("admissions", []):
+            _enrich_admission(admission)
+    
+    return analysis_data
+
+def enrich_and_tag(analysis_data):
+    """
+    填充学校排名并计算学生标签，只遍历一次所有录取记录
+    
+    与依次调用enrich_school_rankings和calculate_student_tags的结果相同
+    
+    Args:
+        analysis_data (dict): 包含学生信息的字典(LLM处理后的数据)，排名信息会被原地填充
+    
+    Returns:
+        str or None: 加号分隔的标签字符串，如果没有任何适用标签则返回None
+    """
+    # 检查输入是否有效
+    if not analysis_data or not isinstance(analysis_data, dict):
+        return None
+    
+    has_scholarship = good_ranking = has_k12_school = False
+    for offer in analysis_data.get("offer_analyses", []):
+        for admission in offer.get("admissions", []):
+            # 先填充排名，"低分逆袭"标签依赖填充后的排名
+            _enrich_admission(admission)
+            has_scholarship = has_scholarship or _has_scholarship(admission)
+            good_ranking = good_ranking or _has_good_ranking(admission)
+            has_k12_school = has_k12_school or _is_k12_admission(admission)
+    
+    return _join_tags(
+        has_scholarship,
+        _is_low_score(analysis_data.get("resume_analysis", {})),
+        good_ranking,
+        has_k12_school
+    )
+
+def main(resume_file=None, offer_file=None):
+    """
+    测试LLM处理器与简化版处理器的集成
+    
+    Args:
+        resume_file (str): 简历PDF文件路径，为None时交互选择
+        offer_file (str): Offer PDF文件路径，只在指定了resume_file时使用
+    """
+    print("=== 测试LLM处理器与简化版处理器的集成 ===")
+    
+    # 加载配置
+    config = load_api_config()
+    
+    # 检查API配置
+    if not config or "OPENAI_API_KEY" not in config:
+        print("警告: 配置文件中未找到OPENAI_API_KEY")
+        print("尝试从环境变量获取...")
+        
+        # 尝试从环境变量获取
+        api_key = os.environ.get("OPENAI_API_KEY")
+        if not api_key:
+            print("错误: 未能获取API密钥，请确保api_config.json包含OPENAI_API_KEY或设置环境变量")
+            return
+    
+    # 创建处理器实例
+    processor = SimpleProcessor()
+    
+    # 创建LLM处理器实例
+    try:
+        llm_processor = LLMProcessor()
+        print("LLM处理器初始化成功")
+    except ValueError as e:
+        print(f"LLM处理器初始化失败: {e}")
+        return
+    
+    # 获取当前目录及其父目录
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    parent_dir = os.path.dirname(current_dir)
+    
+    # 命令行未指定简历文件时，查找PDF文件并交互选择
+    selected_resume = resume_file
+    selected_offer = offer_file
+    if selected_resume is None:
+        # 查找工作目录中的PDF文件
+        pdf_files = [
+            str(path) for path in Path(parent_dir, 'simple_processor').rglob('*')
+            if path.suffix.lower() == '.pdf' and path.is_file()
+        ]
+        
+        if not pdf_files:
+            print("未找到PDF文件，请确保文件夹中包含PDF文件")
+            return
+        
+        # 显示找到的文件
+        print(f"\n找到 {len(pdf_files)} 个PDF文件:")
+        for i, file in enumerate(pdf_files):
+            print(f"{i+1}. {file}")
+        
+        # 如果找到多个文件，让用户选择
+        if len(pdf_files) == 1:
+            # 只有一个文件，将其作为简历处理
+            print("\n只找到一个PDF文件，将其作为简历处理")
+            selected_resume = pdf_files[0]
+        else:
+            # 有多个文件，让用户选择
+            print("\n请选择简历文件(输入编号):")
+            try:
+                resume_index = int(input("> ")) - 1
+                if 0 <= resume_index < len(pdf_files):
+                    selected_resume = pdf_files[resume_index]
+                
+                    print("\n请选择Offer文件(输入编号，或输入0跳过):")
+                    offer_index = int(input("> ")) - 1
+                    if 0 <= offer_index < len(pdf_files) and offer_index != resume_index:
+                        selected_offer = pdf_files[offer_index]
+                else:
+                    print("输入的编号无效，将只处理简历文件")
+                    selected_resume = pdf_files[0] if pdf_files else None
+            except ValueError:
+                print("输入无效，将只处理第一个PDF文件作为简历")
+                selected_resume = pdf_files[0] if pdf_files else None
+    
+    # 提取简历文本
+    resume_text = None
+    if selected_resume:
+        print(f"\n=== 处理简历文件: {selected_resume} ===")
+        resume_result = processor.process_resume(selected_resume)
+        
+        if resume_result["success"]:
+            print("简历文本提取成功")
+            print(f"提取文本长度: {len(resume_result['content'])}")
+            print("\n文本预览(前200字符):")
+            print(resume_result["content"][:200] + "...")
+            resume_text = resume_result["content"]
+        else:
+            print(f"简历处理失败: {resume_result['error']}")
+    
+    # 提取Offer文本
+    offer_text = None
+    if selected_offer:
+        print(f"\n=== 处理Offer文件: {selected_offer} ===")
+        offer_result = processor.process_resume(selected_offer)  # 使用resume方法提取文本
+        
+        if offer_result["success"]:
+            print("Offer文本提取成功")
+            print(f"提取文本长度: {len(offer_result['content'])}")
+            print("\n文本预览(前200字符):")
+            print(offer_result["content"][:200] + "...")
+            offer_text = offer_result["content"]
+        else:
+            print(f"Offer处理失败: {offer_result['error']}")
+    
+    if resume_text is None and offer_text is None:
+        return
+    
+    # 使用LLM同时分析简历和Offer文本（两次请求互不依赖，并行发送）
+    print("\n=== 使用LLM分析简历和Offer ===")
+    resume_analysis, offer_analysis = asyncio.run(_analyze_documents(llm_processor, resume_text, offer_text))
+    
+    if resume_analysis is not None:
+        print("\n=== 简历分析结果 ===")
+        _print_and_save_analysis(resume_analysis, os.path.join(current_dir, "resume_analysis.json"))
+    if offer_analysis is not None:
+        print("\n=== Offer分析结果 ===")
+        _print_and_save_analysis(offer_analysis, os.path.join(current_dir, "offer_analysis.json"))
+
+async def _analyze_documents(llm_processor, resume_text, offer_text):
+    """
+    并行分析简历和Offer文本
+    
+    Args:
+        llm_processor (LLMProcessor): LLM处理器
+        resume_text (str): 简历文本，为None时不分析
+        offer_text (str): Offer文本，为None时不分析
+    
+    Returns:
+        tuple: (简历分析结果, Offer分析结果)，未分析的一项为None
+    """
+    async def no_result():
+        return None
+    
+    # 在async with块内共享同一个HTTP会话
+    async with llm_processor:
+        return await asyncio.gather(
+            llm_processor.analyze_resume_async(resume_text) if resume_text is not None else no_result(),
+            llm_processor.analyze_offer_async(offer_text) if offer_text is not None else no_result()
+        )
+
+def _print_and_save_analysis(analysis, output_file):
+    """
+    打印LLM分析结果，成功时保存到文件
+    
+    Args:
+        analysis (dict): LLM分析结果
+        output_file (str): 输出文件路径
+    """
+    # 检查是否有错误
+    if "error" in analysis:
+        print(f"LLM分析失败: {analysis.get('error')}")
+        if "details" in analysis:
+            print(f"详细信息: {analysis.get('details')}")
+        return
+    
+    print("LLM分析成功，结果如下:")
+    # 只序列化一次（UTF-8字节，中文字符不转义），同时用于显示和保存
+    result_bytes = _dump_json_bytes(analysis)
+    print(result_bytes.decode('utf-8'))
+    
+    # 保存分析结果
+    with open(output_file, 'wb') as f:
+        f.write(result_bytes)
+    print(f"\n分析结果已保存到: {output_file}")
+
+async def test_async_processing(resume_file=None, offer_files=None):
+    """
+    测试异步并行处理简历和Offer文件
+    
+    Args:
+        resume_file (str): 简历PDF文件路径，为None时交互选择
+        offer_files (list): Offer PDF文件路径列表，只在指定了resume_file时使用
+    """
+    # 获取当前目录
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    
+    # 创建处理器实例
+    processor = SimpleProcessor()
+    llm_processor = LLMProcessor()
+    
+    # 命令行未指定简历文件时，查找PDF文件并交互选择（在线程中读取输入，不阻塞事件循环）
+    selected_resume = resume_file
+    selected_offers = list(offer_files or [])
+    if selected_resume is None:
+        # 寻找样本文件
+        pdf_files = []
+        for file in os.listdir(current_dir):
+            if file.lower().endswith('.pdf'):
+                pdf_files.append(os.path.join(current_dir, file))
+        
+        # 显示找到的文件
+        print(f"\n找到 {len(pdf_files)} 个PDF文件:")
+        for i, file in enumerate(pdf_files):
+            print(f"{i+1}. {file}")
+        
+        # 如果找到多个文件，让用户选择
+        if len(pdf_files) == 1:
+            # 只有一个文件，将其作为简历处理
+            print("\n只找到一个PDF文件，将其作为简历处理")
+            selected_resume = pdf_files[0]
+        else:
+            # 有多个文件，让用户选择
+            print("\n请选择简历文件(输入编号):")
+            try:
+                resume_index = int(await asyncio.to_thread(input, "> ")) - 1
+                if 0 <= resume_index < len(pdf_files):
+                    selected_resume = pdf_files[resume_index]
+                
+                    print("\n请选择一个或多个Offer文件(输入编号，用逗号分隔，如'1,3,4'，或输入0跳过):")
+                    offer_input = await asyncio.to_thread(input, "> ")
+                    if offer_input != "0":
+                        offer_indices = [int(idx.strip()) - 1 for idx in offer_input.split(",")]
+                        for idx in offer_indices:
+                            if 0 <= idx < len(pdf_files) and idx != resume_index:
+                                selected_offers.append(pdf_files[idx])
+                else:
+                    print("输入的编号无效，将只处理简历文件")
+                    selected_resume = pdf_files[0] if pdf_files else None
+            except ValueError:
+                print("输入无效，将只处理第一个PDF文件作为简历")
+                selected_resume = pdf_files[0] if pdf_files else None
+    
+    if not selected_resume:
+        print("未选择任何简历文件，退出测试")
+        return
+    
+    # 提取简历文本
+    print(f"\n=== 提取简历文本: {selected_resume} ===")
+    resume_result = processor.process_resume(selected_resume)
+    
+    if not resume_result["success"]:
+        print(f"简历处理失败: {resume_result['error']}")
+        return
+    
+    print("简历文本提取成功")
+    print(f"提取文本长度: {len(resume_result['content'])}")
+    
+    # 在线程池中并行提取所有Offer文本，同时进行的提取数不超过CPU核数
+    semaphore = asyncio.Semaphore(os.cpu_count() or 4)
+    
+    async def extract_offer(offer_file):
+        async with semaphore:
+            return await asyncio.to_thread(processor.process_resume, offer_file)  # 使用resume方法提取文本
+    
+    offer_results = await asyncio.gather(*(extract_offer(offer_file) for offer_file in selected_offers))
+    
+    offer_texts = []
+    for offer_file, offer_result in zip(selected_offers, offer_results):
+        print(f"\n=== 提取Offer文本: {offer_file} ===")
+        if offer_result["success"]:
+            print(f"Offer文本提取成功，长度: {len(offer_result['content'])}")
+            offer_texts.append(offer_result["content"])
+        else:
+            print(f"Offer处理失败: {offer_result['error']}")
+    
+    # 如果没有有效的Offer文本，则只处理简历
+    if not offer_texts:
+        print("\n=== 没有有效的Offer文本，只处理简历 ===")
+        # 使用异步方法处理简历
+        async with llm_processor:
+            resume_analysis = await llm_processor.analyze_resume_async(resume_result["content"])
+        print("\n简历分析结果:")
+        print(_dump_json_bytes(resume_analysis).decode('utf-8'))
+        return
+    
+    # 使用异步方法并行处理简历和所有Offer
+    print("\n=== 开始异步并行处理简历和所有Offer ===")
+    start_time = asyncio.get_event_loop().time()
+    
+    combined_result = await llm_processor.process_documents(
+        resume_text=resume_result["content"],
+        offer_texts=offer_texts
+    )
+    
+    elapsed = asyncio.get_event_loop().time() - start_time
+    print(f"\n异步处理完成! 总耗时: {elapsed:.2f}秒")
+    
+    # 打印结果
+    print("\n=== 简历分析结果 ===")
+    print(_dump_json_bytes(combined_result["resume_analysis"]).decode('utf-8'))
+    
+    print("\n=== Offer分析结果 ===")
+    for i, offer_analysis in enumerate(combined_result["offer_analyses"]):
+        print(f"\nOffer #{i+1} 分析结果:")
+        print(_dump_json_bytes(offer_analysis).decode('utf-8'))
+    
+    # 增强学校排名信息并计算标签
+    tags = enrich_and_tag(combined_result)
+    combined_result["tags"] = tags
+    print(f"\n添加标签: {tags}")
+    
+    # 保存结果
+    output_file = os.path.join(current_dir, "combined_analysis.json")
+    if processor.save_results(combined_result, output_file):
+        print(f"\n组合分析结果已保存到: {output_file}")
+
+if __name__ == "__main__":
+    # 命令行参数：指定文件时不再交互选择，便于脚本化批量运行
+    parser = argparse.ArgumentParser(description='测试LLM处理器与简化版处理器的集成')
+    parser.add_argument('--async', dest='is_async', action='store_true', help='运行异步版本，并行处理简历和多个Offer')
+    parser.add_argument('--resume', help='简历PDF文件路径，不指定时交互选择')
+    parser.add_argument('--offer', action='append', default=[], help='Offer PDF文件路径，可重复指定（同步版本只使用第一个）')
+    args = parser.parse_args()
+    # 不指定简历时会交互选择所有文件，单独指定的Offer不会被使用
+    if args.offer and not args.resume:
+        parser.error("--offer 需要与 --resume 一起使用")
+    
+    # 根据命令行参数选择运行同步或异步版本
+    if args.is_async:
+        print("运行异步版本的测试...")
+        asyncio.run(test_async_processing(args.resume, args.offer))
+    else:
+        print("运行同步版本的测试...")
+        main(args.resume, args.offer[0] if args.offer else None)
+        
+# 运行方式
+#    python test_llm.py --async  # 异步模式
+#    python test_llm.py          # 同步模式
+#    python test_llm.py --async --resume resume.pdf --offer offer1.pdf --offer offer2.pdf  # 指定文件，不交互选择
@@ -0,0 +1,14 @@
+from test_llm import _lookup_rank
+
+def test_exact_and_partial_matches():
+    """精确匹配和部分匹配仍能找到排名"""
+    assert _lookup_rank("QS", "harvard university") == 4
+    assert _lookup_rank("QS", "massachusetts institute of technology") == 1
+    assert _lookup_rank("US News", "princeton university") == 1
+
+def test_similar_names_do_not_match():
+    """名称相近的不同学校不能互相匹配到对方的排名"""
+    # Northeastern与Northwestern（排名6）只差两个字母
+    assert _lookup_rank("US News", "northeastern university") is None
+    # Washington University与University of Washington（排名76）词语相同、顺序不同
+    assert _lookup_rank("QS", "washington university") is None